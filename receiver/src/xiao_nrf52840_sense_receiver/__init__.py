@@ -65,6 +65,20 @@ def main() -> None:
         help="Use mock data for testing (no BLE device required)",
     )
 
+    parser.add_argument(
+        "--record-compression",
+        choices=["zstd"],
+        default=None,
+        help="Compress recorded files (zstd writes .csv.zst; requires the zstd extra, "
+        "only valid in oscilloscope mode)",
+    )
+    parser.add_argument(
+        "--record-binary-spool",
+        action="store_true",
+        help="Spool recordings in binary form and convert them to CSV when "
+        "recording stops (only valid in oscilloscope mode)",
+    )
+
     # CSV output mode options (default is oscilloscope)
     parser.add_argument(
         "--csv",
@@ -157,7 +171,11 @@ def main() -> None:
 
         # Create and start application
         try:
-            app = create_app(data_source=data_source)
+            app = create_app(
+                data_source=data_source,
+                record_compression=args.record_compression,
+                record_binary_spool=args.record_binary_spool,
+            )
             app.start_data_collection()
 
             try:
@@ -22,9 +22,24 @@ Architecture:
 - Async/await throughout ensures non-blocking operation under high data rates
 - Producer-consumer pattern decouples data collection from processing
 
+Performance:
+The link carries a few hundred short CSV lines per second. The receive path is
+therefore neither compute-bound nor memory-bandwidth-bound; its cost is Python
+interpreter overhead paid per sample (callbacks, queue operations, parsing,
+object construction, logging). Optimizations should cut or amortize per-sample
+calls, for example:
+- Drain the line queue per burst and hand batches downstream
+  (_process_message_queue, stream_batches(), DataBuffer.extend())
+- Keep DataBuffer in preallocated NumPy rings instead of per-row objects
+- Parse with a single split() and builtin int()/float() (ImuRow.parse_csv)
+- Skip log formatting unless DEBUG is enabled, and use uvloop when installed
+SIMD, GPU offload or a compiled CSV parser do not pay off at this payload size.
+Numba and third-party float parsers were measured and were not faster here.
+
 Requirements:
 - bleak: Cross-platform BLE library for device communication
 - asyncio: Async I/O support for concurrent operation
+- uvloop (optional, ``uv sync --extra fast-loop``): Faster event loop for run()
 """
 
 from __future__ import annotations
@@ -33,18 +48,35 @@ import asyncio
 import logging
 import math
 import random
+import re
+import string
+import sys
 import threading
 import time
 from abc import ABC, abstractmethod
-from collections import deque
-from dataclasses import dataclass
-from typing import AsyncGenerator, AsyncIterator, Callable, Iterable, Optional
-
+from dataclasses import dataclass, field, replace
+from typing import (
+    AsyncGenerator,
+    AsyncIterator,
+    Callable,
+    Iterable,
+    NamedTuple,
+    Optional,
+    Sequence,
+)
+
+import numpy as np
 from bleak import BleakClient, BleakScanner
+from bleak.backends.characteristic import BleakGATTCharacteristic
 from bleak.backends.device import BLEDevice
 from bleak.backends.scanner import AdvertisementData
 from bleak.exc import BleakError
 
+try:
+    import uvloop
+except ImportError:  # Optional dependency
+    uvloop = None  # type: ignore[assignment]
+
 
 # Nordic UART Service (NUS) UUID constants
 NUS_SERVICE = "6e400001-b5a3-f393-e0a9-e50e24dcca9e"
@@ -54,15 +86,23 @@ NUS_RX_CHAR = "6e400002-b5a3-f393-e0a9-e50e24dcca9e"  # Write (client to device,
 
 DEVICE_NAME = "XIAO Sense IMU"
 
+# Parsed lines waiting for the stream consumer (~40s at 100Hz); lines
+# arriving while it is full are dropped rather than queued without bound
+LINE_QUEUE_MAXSIZE = 4096
 
-@dataclass(frozen=True)
-class ImuRow:
+# Column names of DataBuffer's columnar (structure-of-arrays) view, in ImuRow
+# field order
+IMU_COLUMNS = ("millis", "ax", "ay", "az", "gx", "gy", "gz", "tempC", "audioRMS")
+
+
+class ImuRow(NamedTuple):
     """Represents a single IMU sensor data row from the XIAO nRF52840 Sense device.
 
     This class encapsulates one complete sensor reading containing accelerometer,
-    gyroscope, temperature, and audio RMS values. The frozen dataclass design
+    gyroscope, temperature, and audio RMS values. The named tuple design
     ensures immutability, which is crucial for data integrity in a streaming
-    system where data flows through multiple processing stages.
+    system where data flows through multiple processing stages, and keeps
+    per-row construction cheap on the ingestion hot path.
 
     The field order matches the CSV format transmitted by the XIAO device:
     millis,ax,ay,az,gx,gy,gz,tempC,audioRMS
@@ -82,8 +122,9 @@ class ImuRow:
             indication without raw audio data transmission.
 
     Note:
-        The frozen=True parameter prevents accidental mutation of sensor data,
-        ensuring data integrity throughout the processing pipeline.
+        Being a tuple prevents accidental mutation of sensor data, ensuring
+        data integrity throughout the processing pipeline. A row is also its
+        own IMU_COLUMNS value tuple, so NumPy can consume rows directly.
     """
 
     millis: int
@@ -123,27 +164,13 @@ class ImuRow:
             sometimes introduces extra spaces due to packet fragmentation
             and reassembly at the protocol level.
         """
-        # Input typically uses ", " but be lenient with whitespace variations
-        parts = [p.strip() for p in line.split(",")]
+        # int() and float() ignore surrounding whitespace themselves, so the
+        # fields need no separate strip() for inputs using ", "
+        parts = line.split(",")
         if len(parts) != 9:
             raise ValueError(f"Unexpected CSV fields count: {len(parts)} in '{line}'")
 
-        millis = int(parts[0])
-        ax, ay, az = float(parts[1]), float(parts[2]), float(parts[3])
-        gx, gy, gz = float(parts[4]), float(parts[5]), float(parts[6])
-        tempC = float(parts[7])
-        audioRMS = float(parts[8])
-        return ImuRow(
-            millis=millis,
-            ax=ax,
-            ay=ay,
-            az=az,
-            gx=gx,
-            gy=gy,
-            gz=gz,
-            tempC=tempC,
-            audioRMS=audioRMS,
-        )
+        return ImuRow(int(parts[0]), *map(float, parts[1:]))
 
 
 @dataclass
@@ -165,8 +192,9 @@ class BufferStats:
             buffer utilization and detect approaching overflow conditions.
         sample_rate: Current data ingestion rate in samples per second. Calculated
             from time intervals between consecutive updates.
-        last_update: Timestamp of the most recent statistics update. Used internally
-            for sample rate calculations.
+        last_update: time.monotonic() reading of the most recent statistics
+            update. Used internally for sample rate calculations; being
+            monotonic, it is unaffected by wall-clock adjustments.
 
     Note:
         Sample rate calculation uses a simple interval-based approach rather than
@@ -194,13 +222,34 @@ class BufferStats:
             between consecutive calls. This provides instantaneous rate rather
             than smoothed averages, making it responsive to connection changes.
         """
-        current_time = time.time()
+        current_time = time.monotonic()
         if self.last_update > 0:
             time_diff = current_time - self.last_update
             if time_diff > 0:
                 self.sample_rate = 1.0 / time_diff
         self.last_update = current_time
 
+    def update_batch(self, count: int) -> None:
+        """Update statistics with a batch of samples ingested at once.
+
+        Args:
+            count: Number of samples that arrived since the previous update.
+                The rate is derived from this count over the elapsed interval,
+                so batched ingestion reports the real sample rate rather than
+                the batch cadence.
+        """
+        current_time = time.monotonic()
+        if self.last_update > 0:
+            time_diff = current_time - self.last_update
+            if time_diff > 0:
+                self.sample_rate = count / time_diff
+        self.last_update = current_time
+
+
+def _block_rows(block: np.ndarray) -> list[ImuRow]:
+    """Rebuild ImuRow objects from a (channels, n) sample block."""
+    return [ImuRow(int(values[0]), *values[1:]) for values in block.T.tolist()]
+
 
 class DataBuffer:
     """Thread-safe circular buffer optimized for real-time sensor data streaming.
@@ -213,8 +262,10 @@ class DataBuffer:
        monotonic indices to detect data loss during concurrent access, essential
        for reliable data recording.
 
-    2. **Thread safety**: Uses RLock to handle recursive locking scenarios while
-       maintaining performance for high-frequency writes (~25Hz BLE + ~100Hz simulation).
+    2. **Thread safety**: The collection thread writes while Dash callbacks and
+       the recording thread read, so every access takes one plain Lock. Public
+       methods never nest, and rows are rebuilt after the lock is released to
+       keep the writer's waits short.
 
     3. **Non-blocking statistics**: Real-time stats calculation without separate
        threads, minimizing system complexity.
@@ -225,13 +276,20 @@ class DataBuffer:
     The circular nature prevents unbounded memory growth while the index tracking
     ensures recording threads can detect gaps in the data stream.
 
+    Samples are stored column-wise in a preallocated NumPy ring (one float64
+    row per channel), so ingestion keeps no per-sample Python objects alive
+    and visualization can slice and decimate windows with array indexing.
+    ImuRow objects are rebuilt only for the rows a caller asks for; float64
+    holds both the float channels and the millis counter exactly.
+
     Attributes:
         _max_size: Maximum buffer capacity before oldest entries are dropped.
-        _buffer: Circular deque storing actual IMU data rows.
-        _lock: Reentrant lock for thread-safe operations.
+        _lock: Lock guarding the rings, indices and statistics.
         _stats: Real-time statistics tracking buffer state and data ranges.
         _write_index: Monotonically increasing counter for all writes ever made.
         _base_index: Index of the oldest sample currently in the buffer.
+        _columns: Channel ring arrays; sample index i lives at i % _max_size.
+            Samples _base_index.._write_index-1 are valid.
 
     Note:
         The index-based design is specifically required for the recording system
@@ -249,14 +307,16 @@ class DataBuffer:
                 short-term recording without excessive memory usage.
         """
         self._max_size = max_size
-        self._buffer: deque[ImuRow] = deque(maxlen=max_size)
-        self._lock = threading.RLock()
+        self._lock = threading.Lock()
         self._stats = BufferStats()
 
         # Index-based access for recording (enables gap detection)
         self._write_index = 0  # Monotonic counter for all writes
         self._base_index = 0  # Index of first element currently in buffer
 
+        # Channel rings holding the buffered samples
+        self._columns = np.zeros((len(IMU_COLUMNS), max_size), dtype=np.float64)
+
     def append(self, row: ImuRow) -> None:
         """Add new sensor data row to buffer with automatic statistics update.
 
@@ -274,14 +334,48 @@ class DataBuffer:
         """
         with self._lock:
             # Check if we're about to drop data due to circular buffer overflow
-            if len(self._buffer) == self._max_size:
-                self._base_index += 1  # First element will be dropped
+            if self._write_index - self._base_index == self._max_size:
+                self._base_index += 1  # Oldest sample will be overwritten
 
-            self._buffer.append(row)
+            self._columns[:, self._write_index % self._max_size] = row
             self._write_index += 1
-            self._stats.fill_level = len(self._buffer)
+            self._stats.fill_level = self._write_index - self._base_index
             self._stats.update(row)
 
+    def extend(self, rows: Sequence[ImuRow]) -> None:
+        """Add a batch of sensor rows under a single lock acquisition.
+
+        Equivalent to calling append() for each row, but the channel rings and
+        the statistics are updated once per batch. The rows are written into
+        the rings with at most two slice assignments (one before and one after
+        the wrap-around point).
+
+        Args:
+            rows: IMU readings ordered from oldest to newest.
+        """
+        count = len(rows)
+        if count == 0:
+            return
+
+        # Only the newest max_size rows can survive in the ring
+        kept = rows[-self._max_size :]
+        block = np.array(kept, dtype=np.float64).T
+
+        with self._lock:
+            overflow = self._write_index - self._base_index + count - self._max_size
+            if overflow > 0:
+                self._base_index += overflow
+
+            start = (self._write_index + count - len(kept)) % self._max_size
+            first = min(len(kept), self._max_size - start)
+            self._columns[:, start : start + first] = block[:, :first]
+            if first < len(kept):
+                self._columns[:, : len(kept) - first] = block[:, first:]
+
+            self._write_index += count
+            self._stats.fill_level = self._write_index - self._base_index
+            self._stats.update_batch(count)
+
     def get_recent(self, count: int) -> list[ImuRow]:
         """Get the most recent N data points for visualization.
 
@@ -297,15 +391,105 @@ class DataBuffer:
             List of IMU rows ordered from oldest to newest in the requested range.
 
         Note:
-            Returns a shallow copy to prevent external modification of buffer
-            contents while avoiding expensive deep copying of sensor data.
+            Rows are rebuilt from the channel rings, so only the requested
+            samples are materialized as ImuRow objects.
         """
         with self._lock:
-            return (
-                list(self._buffer)[-count:]
-                if count <= len(self._buffer)
-                else list(self._buffer)
-            )
+            end = self._write_index
+            start = max(self._base_index, end - max(count, 0))
+            block = self._block_range(start, end)
+        return _block_rows(block)
+
+    def get_recent_arrays(
+        self, count: int, align: int = 1
+    ) -> tuple[dict[str, np.ndarray], int, int]:
+        """Get the most recent N samples as per-channel arrays.
+
+        The window is gathered with a single fancy index over the channel
+        rings, avoiding per-sample Python work.
+
+        Args:
+            count: Maximum number of recent samples forming the window.
+            align: When greater than 1, the window is shrunk to whole blocks of
+                align samples starting at a multiple of align, so downsampling
+                buckets stay fixed while the window slides.
+
+        Returns:
+            tuple of (mapping of IMU_COLUMNS name to array, absolute index of
+            the first returned sample, index one past the last one).
+        """
+        with self._lock:
+            start, end = self._aligned_window(count, align)
+            return self._columns_range(start, end), start, end
+
+    def get_arrays_since(
+        self, last_index: int, count: int, align: int = 1
+    ) -> tuple[dict[str, np.ndarray], dict[str, tuple[float, float]], int, int]:
+        """Get the samples a sliding window gained since last_index.
+
+        Incremental counterpart of get_recent_arrays(): only samples from
+        max(last_index, start) onwards are copied, and the window's per-channel
+        extents are reduced in place on the rings, so the cost follows the
+        number of new samples rather than the window length.
+
+        Args:
+            last_index: End index returned by a previous call.
+            count: Maximum number of recent samples forming the window.
+            align: Block alignment as in get_recent_arrays().
+
+        Returns:
+            tuple of (mapping of IMU_COLUMNS name to the new samples, mapping
+            of IMU_COLUMNS name to (min, max) over the whole window, window
+            start index, window end index). The extents mapping is empty when
+            the window is.
+        """
+        with self._lock:
+            start, end = self._aligned_window(count, align)
+            new_start = min(max(last_index, start), end)
+            extents: dict[str, tuple[float, float]] = {}
+            if end > start:
+                lows = np.full(len(IMU_COLUMNS), np.inf)
+                highs = np.full(len(IMU_COLUMNS), -np.inf)
+                for part in self._ring_slices(start, end):
+                    np.minimum(lows, part.min(axis=1), out=lows)
+                    np.maximum(highs, part.max(axis=1), out=highs)
+                extents = {
+                    name: (float(lows[i]), float(highs[i]))
+                    for i, name in enumerate(IMU_COLUMNS)
+                }
+            return self._columns_range(new_start, end), extents, start, end
+
+    def _aligned_window(self, count: int, align: int) -> tuple[int, int]:
+        """Return (start, end) of the newest count samples, trimmed to align."""
+        end = self._write_index - self._write_index % align
+        start = max(self._base_index, end - max(count, 0))
+        return min(start + (-start) % align, end), end
+
+    def _columns_range(self, start: int, end: int) -> dict[str, np.ndarray]:
+        """Copy samples start..end-1 out of the channel rings.
+
+        The range is contiguous in the ring or wraps once, so it is copied
+        with at most two slices. A copy (rather than a view) is returned
+        because the writer keeps overwriting the ring after the lock is
+        released.
+        """
+        block = self._block_range(start, end)
+        return {name: block[i] for i, name in enumerate(IMU_COLUMNS)}
+
+    def _block_range(self, start: int, end: int) -> np.ndarray:
+        """Copy samples start..end-1 out of the rings as a (channels, n) array."""
+        if end <= start:
+            return self._columns[:, :0].copy()
+        parts = self._ring_slices(start, end)
+        return parts[0].copy() if len(parts) == 1 else np.concatenate(parts, axis=1)
+
+    def _ring_slices(self, start: int, end: int) -> list[np.ndarray]:
+        """Views of the channel rings covering samples start..end-1, in order."""
+        first = start % self._max_size
+        last = first + (end - start)
+        if last <= self._max_size:
+            return [self._columns[:, first:last]]
+        return [self._columns[:, first:], self._columns[:, : last - self._max_size]]
 
     def get_all(self) -> list[ImuRow]:
         """Get all data points currently in buffer.
@@ -318,7 +502,8 @@ class DataBuffer:
             For recording operations, prefer get_since_index() for efficiency.
         """
         with self._lock:
-            return list(self._buffer)
+            block = self._block_range(self._base_index, self._write_index)
+        return _block_rows(block)
 
     def get_since_index(self, last_index: int) -> tuple[list[ImuRow], int, bool]:
         """Retrieve new samples since last_index with data loss detection.
@@ -353,21 +538,12 @@ class DataBuffer:
             # Detect if requested data was dropped from circular buffer
             dropped = last_index < self._base_index
 
-            if dropped:
-                # Return all available data and warn about loss
-                return list(self._buffer), self._write_index, True
-
-            # Calculate slice indices within current buffer
-            start_offset = max(0, last_index - self._base_index)
-            end_offset = self._write_index - self._base_index
-
-            if start_offset >= len(self._buffer):
-                # No new data available
-                return [], self._write_index, False
-
-            # Return slice of buffer containing new data
-            samples = list(self._buffer)[start_offset:end_offset]
-            return samples, self._write_index, False
+            # On loss return all available data, otherwise the new tail of
+            # the buffer (empty when caught up)
+            start = self._base_index if dropped else last_index
+            block = self._block_range(start, self._write_index)
+            next_index = self._write_index
+        return _block_rows(block), next_index, dropped
 
     def clear(self) -> None:
         """Clear all buffer contents and reset index tracking.
@@ -381,22 +557,23 @@ class DataBuffer:
             become invalid and should not be reused.
         """
         with self._lock:
-            self._buffer.clear()
             self._stats.fill_level = 0
             # Reset index tracking
             self._write_index = 0
             self._base_index = 0
+            self._columns.fill(0.0)
 
     @property
     def stats(self) -> BufferStats:
-        """Get current buffer statistics for monitoring and debugging.
+        """Get a consistent snapshot of the buffer statistics.
 
         Returns:
-            BufferStats: Real-time statistics including fill level and
-                data range information, calculated during normal operations.
+            BufferStats: Copy of the statistics taken under one lock
+                acquisition. fill_level equals the buffer size at that moment,
+                so callers needing both can read them from one snapshot.
         """
         with self._lock:
-            return self._stats
+            return replace(self._stats)
 
     @property
     def size(self) -> int:
@@ -406,7 +583,7 @@ class DataBuffer:
             Current buffer occupancy, useful for monitoring buffer utilization.
         """
         with self._lock:
-            return len(self._buffer)
+            return self._write_index - self._base_index
 
     @property
     def max_size(self) -> int:
@@ -784,7 +961,7 @@ class MockDataSource(DataSource):
         self._connected = False
         self._running = False
         self._update_interval = update_interval
-        self._start_time = time.time()
+        self._start_time = time.monotonic()
 
     async def is_connected(self) -> bool:
         """Check if mock data source is active.
@@ -810,7 +987,7 @@ class MockDataSource(DataSource):
         """
         self._connected = True
         self._running = True
-        self._start_time = time.time()
+        self._start_time = time.monotonic()
 
     async def stop(self) -> None:
         """Stop mock data generation.
@@ -857,51 +1034,42 @@ class MockDataSource(DataSource):
         self._connected = True
         self._running = True
 
+        # Bound locally and precomputed once: the loop runs per sample
+        sin, cos, gauss, rand, now = (
+            math.sin,
+            math.cos,
+            random.gauss,
+            random.random,
+            time.monotonic,
+        )
+        w_ax, w_ay, w_az = math.tau * 0.5, math.tau * 0.3, math.tau * 0.1
+        w_gx, w_gy, w_gz = math.tau * 0.8, math.tau * 0.6, math.tau * 0.4
+        w_temp, w_audio = math.tau * 0.01, math.tau * 2.0
+
         try:
             counter = 0
             while self._running:
-                current_time = time.time()
-                elapsed = current_time - self._start_time
+                elapsed = now() - self._start_time
 
                 # Generate sinusoidal data with some noise
-                ax = 0.5 * math.sin(2 * math.pi * 0.5 * elapsed) + random.gauss(0, 0.1)
-                ay = 0.3 * math.cos(2 * math.pi * 0.3 * elapsed) + random.gauss(0, 0.1)
-                az = (
-                    1.0
-                    + 0.2 * math.sin(2 * math.pi * 0.1 * elapsed)
-                    + random.gauss(0, 0.05)
-                )
+                ax = 0.5 * sin(w_ax * elapsed) + gauss(0, 0.1)
+                ay = 0.3 * cos(w_ay * elapsed) + gauss(0, 0.1)
+                az = 1.0 + 0.2 * sin(w_az * elapsed) + gauss(0, 0.05)
 
-                gx = 10.0 * math.sin(2 * math.pi * 0.8 * elapsed) + random.gauss(0, 2.0)
-                gy = 15.0 * math.cos(2 * math.pi * 0.6 * elapsed) + random.gauss(0, 2.0)
-                gz = 5.0 * math.sin(2 * math.pi * 0.4 * elapsed) + random.gauss(0, 1.0)
+                gx = 10.0 * sin(w_gx * elapsed) + gauss(0, 2.0)
+                gy = 15.0 * cos(w_gy * elapsed) + gauss(0, 2.0)
+                gz = 5.0 * sin(w_gz * elapsed) + gauss(0, 1.0)
 
-                tempC = (
-                    25.0
-                    + 3.0 * math.sin(2 * math.pi * 0.01 * elapsed)
-                    + random.gauss(0, 0.5)
-                )
+                tempC = 25.0 + 3.0 * sin(w_temp * elapsed) + gauss(0, 0.5)
 
                 # Audio RMS with some random dropouts (-1 indicates missing data)
-                if random.random() > 0.1:  # 90% data availability
-                    audioRMS = abs(
-                        1000.0 * math.sin(2 * math.pi * 2.0 * elapsed)
-                    ) + random.gauss(0, 50.0)
+                if rand() > 0.1:  # 90% data availability
+                    audioRMS = abs(1000.0 * sin(w_audio * elapsed)) + gauss(0, 50.0)
                 else:
                     audioRMS = -1.0
 
-                millis = int(elapsed * 1000)
-
                 row = ImuRow(
-                    millis=millis,
-                    ax=ax,
-                    ay=ay,
-                    az=az,
-                    gx=gx,
-                    gy=gy,
-                    gz=gz,
-                    tempC=tempC,
-                    audioRMS=audioRMS,
+                    int(elapsed * 1000), ax, ay, az, gx, gy, gz, tempC, audioRMS
                 )
 
                 yield row
@@ -975,7 +1143,8 @@ def _match_device(
         dev: BLE device object containing basic device information.
         adv: Advertisement data containing detailed broadcasting information.
         device_name: Target device name for exact string matching.
-        service_uuid: Target service UUID for fallback matching (case-insensitive).
+        service_uuid: Lower-case target service UUID for fallback matching;
+            advertised UUIDs are compared case-insensitively.
 
     Returns:
         True if device matches either name or service UUID criteria, False otherwise.
@@ -999,7 +1168,7 @@ def _match_device(
 
     # Fallback to service UUID matching for broader compatibility
     uuids: Iterable[str] = adv.service_uuids or []
-    if any(u.lower() == service_uuid.lower() for u in uuids):
+    if any(u.lower() == service_uuid for u in uuids):
         logger.info(
             "Device selected by service UUID match: %s (%s)", dev.name, dev.address
         )
@@ -1048,15 +1217,49 @@ async def find_device(
     devices_adv = await _scan_ble_devices(timeout)
 
     # devices_adv: dict[address, (BLEDevice, AdvertisementData)]
+    target_uuid = service_uuid.lower()
     for dev, adv in devices_adv.values():
-        if _match_device(dev, adv, device_name, service_uuid):
+        if _match_device(dev, adv, device_name, target_uuid):
             return dev
     return None
 
 
-def _parse_line_from_buffer(
-    buffer: bytearray, debug_hex_dumped: dict[str, bool]
-) -> Optional[str]:
+# Line delimiters accepted from the firmware, by byte value
+_LINE_DELIMITER_NAMES = {
+    0x0A: "LF",
+    0x0D: "CR",
+    0x00: "NUL",
+    0x1E: "RS",
+    0x1F: "US",
+    0x1D: "GS",
+    0x03: "ETX",
+    0x04: "EOT",
+}
+
+# Characters a line may consist of entirely and still count as noise
+_NOISE_CHARS = string.whitespace + ","
+
+# Finds the earliest delimiter of any kind in a single scan
+_LINE_DELIMITER_RE = re.compile(rb"[\n\r\x00\x1e\x1f\x1d\x03\x04]")
+
+
+@dataclass
+class _ParseState:
+    """Receive-side line assembly state for one BLE connection.
+
+    Attributes:
+        buffer: Accumulated notification bytes not yet consumed as lines.
+        scan_offset: Length of the buffer prefix already searched without
+            finding a delimiter, so the next search starts after it.
+        hex_dumped: Whether the one-time HEX/ASCII preview has been logged.
+    """
+
+    buffer: bytearray = field(default_factory=bytearray)
+    scan_offset: int = 0
+    hex_dumped: bool = False
+
+
+def _parse_line_from_buffer(state: _ParseState) -> Optional[str]:
     """Extract one complete line from the BLE receive buffer.
 
     This function implements robust line parsing for BLE data reception where
@@ -1068,84 +1271,94 @@ def _parse_line_from_buffer(
     1. **Multiple delimiter support**: Handles various line endings (LF, CRLF,
        NUL, RS, US, GS, ETX, EOT) to support different firmware implementations.
     2. **Fragment assembly**: Accumulates partial data until a complete line
-       is available, essential for BLE's packet-based transmission.
+       is available, essential for BLE's packet-based transmission. Bytes
+       already searched are not rescanned when a line spans notifications.
     3. **Buffer overflow protection**: Prevents unbounded memory growth when
        delimiters are missing or corrupted.
     4. **Debug diagnostics**: Provides HEX/ASCII dumps to identify unknown
        control characters during development.
 
     Args:
-        buffer: Mutable byte buffer containing accumulated BLE data fragments.
-            Modified in-place as complete lines are extracted.
-        debug_hex_dumped: State tracking dict to limit debug output frequency.
-            Prevents log spam while providing diagnostic information when needed.
+        state: Line assembly state of the connection. Its buffer is modified
+            in-place as complete lines are extracted.
 
     Returns:
         Complete UTF-8 decoded line string, or None if no complete line is
-        available in the current buffer contents.
+        available in the current buffer contents. Noise lines and lines that
+        fail to decode are skipped, not returned as None, so lines queued
+        behind them are still delivered.
 
     Note:
         The function handles CRLF as a two-character sequence while treating
         other delimiters as single characters. Empty lines and lines containing
         only whitespace/commas are filtered out as transmission noise.
     """
-    delim_map = [
-        (b"\n", "LF"),
-        (b"\r", "CR"),
-        (b"\x00", "NUL"),
-        (b"\x1e", "RS"),
-        (b"\x1f", "US"),
-        (b"\x1d", "GS"),
-        (b"\x03", "ETX"),
-        (b"\x04", "EOT"),
-    ]
-    candidates = []
-    for token, name in delim_map:
-        idx = buffer.find(token)
-        if idx != -1:
-            candidates.append((idx, token, name))
-
-    if not candidates:
-        # No line delimiter found yet
-        if len(buffer) > 0:
-            logger.debug("Buffer accumulating: %d bytes (line incomplete)", len(buffer))
-            # One-time HEX/ASCII preview to identify unknown delimiters or control characters
-            if not debug_hex_dumped["dumped"] and len(buffer) >= 256:
-                _log_buffer_preview(buffer)
-                debug_hex_dumped["dumped"] = True
-            # Buffer overflow protection (trim if exceeds 64KB)
-            if len(buffer) > 64 * 1024:
-                drop = len(buffer) - 64 * 1024
-                logger.warning("Buffer overflow protection: trimming %d bytes", drop)
-                del buffer[:drop]
-        return None
-
-    # Use the earliest occurring delimiter
-    idx, token, token_name = min(candidates, key=lambda t: t[0])
-    # CRLF consumes 2 characters, others consume 1
-    consume = 1
-    delim_name = token_name
-    if token == b"\r" and idx + 1 < len(buffer) and buffer[idx + 1 : idx + 2] == b"\n":
-        consume = 2
-        delim_name = "CRLF"
-
-    # Extract one line (strip trailing CR)
-    line = buffer[:idx].rstrip(b"\r")
-    del buffer[: idx + consume]
+    buffer = state.buffer
+    while True:
+        match = _LINE_DELIMITER_RE.search(buffer, state.scan_offset)
+        if match is None:
+            # No line delimiter found yet
+            if len(buffer) > 0:
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(
+                        "Buffer accumulating: %d bytes (line incomplete)", len(buffer)
+                    )
+                # One-time HEX/ASCII preview to identify unknown delimiters or
+                # control characters; only built when DEBUG output is enabled
+                if (
+                    not state.hex_dumped
+                    and len(buffer) >= 256
+                    and logger.isEnabledFor(logging.DEBUG)
+                ):
+                    _log_buffer_preview(buffer)
+                    state.hex_dumped = True
+                # Buffer overflow protection (trim if exceeds 64KB)
+                if len(buffer) > 64 * 1024:
+                    drop = len(buffer) - 64 * 1024
+                    logger.warning(
+                        "Buffer overflow protection: trimming %d bytes", drop
+                    )
+                    del buffer[:drop]
+            state.scan_offset = len(buffer)
+            return None
+
+        # The search stops at the earliest delimiter of any kind
+        idx = match.start()
+        delimiter = buffer[idx]
+        # CRLF consumes 2 characters, others consume 1
+        consume = 1
+        delim_name = _LINE_DELIMITER_NAMES[delimiter]
+        if delimiter == 0x0D and idx + 1 < len(buffer) and buffer[idx + 1] == 0x0A:
+            consume = 2
+            delim_name = "CRLF"
+
+        # Extract one line (strip trailing CR)
+        line = buffer[:idx].rstrip(b"\r")
+        del buffer[: idx + consume]
+        # The remainder was not searched past the delimiter
+        state.scan_offset = 0
 
-    try:
-        text = line.decode("utf-8", errors="strict")
-    except UnicodeDecodeError:
-        logger.error("UTF-8 decode failed: %r", line)
-        return None
+        try:
+            text = line.decode("utf-8", errors="strict")
+        except UnicodeDecodeError:
+            logger.error("UTF-8 decode failed: %r", line)
+            continue
+
+        # Discard empty lines or lines with only whitespace and commas as
+        # noise and go on with the next line: None means "no complete line".
+        # strip() returns the line itself when nothing is stripped, so real
+        # data lines are checked without allocating
+        if not text.strip(_NOISE_CHARS):
+            logger.debug("Skipping noise line: %r", text)
+            continue
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Line completed (delimiter=%s): %s", delim_name, text)
+        return text
 
-    # Discard empty lines or lines with only whitespace and commas as noise
-    if text.strip() == "" or text.replace(",", "").strip() == "":
-        logger.debug("Skipping noise line: %r", text)
-        return None
 
-    logger.debug("Line completed (delimiter=%s): %s", delim_name, text)
-    return text
+# Every byte value from 0x20 up, deleted to leave only control bytes
+_NON_CONTROL_BYTES = bytes(range(0x20, 0x100))
 
 
 def _log_buffer_preview(buffer: bytearray) -> None:
@@ -1172,12 +1385,13 @@ def _log_buffer_preview(buffer: bytearray) -> None:
             into complete lines. The buffer contents are examined but not modified.
 
     Note:
-        This function is called only when buffer size exceeds 256 bytes without
-        finding valid line delimiters, indicating potential transmission issues
+        This function is called only when DEBUG logging is enabled and the
+        buffer size exceeds 256 bytes without finding valid line delimiters,
+        indicating potential transmission issues
         that require manual analysis for protocol debugging.
     """
     # Inventory control bytes present in buffer (<0x20) for analysis
-    ctrl_set = sorted(set(b for b in buffer if b < 0x20))
+    ctrl_set = sorted(set(buffer.translate(None, _NON_CONTROL_BYTES)))
     if ctrl_set:
         logger.debug(
             "Control bytes present: %s",
@@ -1202,10 +1416,9 @@ def _log_buffer_preview(buffer: bytearray) -> None:
 
 def _create_notification_handler(
     queue: asyncio.Queue[Optional[str]],
-    buffer: bytearray,
-    debug_hex_dumped: dict[str, bool],
+    state: _ParseState,
     disconnected: asyncio.Event,
-) -> Callable[[bytearray], None]:
+) -> Callable[[BleakGATTCharacteristic, bytearray], None]:
     """Create a BLE notification handler with proper closure state management.
 
     This function creates a callback handler for BLE characteristic notifications
@@ -1226,10 +1439,8 @@ def _create_notification_handler(
     Args:
         queue: Async queue for passing parsed lines to consumer threads.
             Uses Optional[str] where None indicates disconnection.
-        buffer: Shared byte buffer for accumulating fragmented BLE data.
+        state: Line assembly state for accumulating fragmented BLE data.
             Modified by the returned handler as data arrives.
-        debug_hex_dumped: State dict controlling debug output frequency
-            to prevent log spam during problematic sessions.
         disconnected: Event flag indicating BLE connection loss.
             Monitored to trigger consumer wakeup on disconnect.
 
@@ -1241,27 +1452,66 @@ def _create_notification_handler(
         The returned handler maintains references to all closure variables,
         enabling stateful processing across multiple BLE notifications while
         isolating each callback invocation from potential errors.
+
+        When a bounded queue is full, newly parsed lines are dropped (queued
+        lines are kept) and the overflow is logged once when it starts and once
+        when it ends. The disconnection sentinel is never dropped: if the queue
+        is full, the oldest queued line is discarded to make room for it.
     """
+    dropped_lines = 0
+    consumer_woken = False
+    # Bound once: the handler runs for every notification
+    put_line = queue.put_nowait
+    extend_buffer = state.buffer.extend
+    parse_line = _parse_line_from_buffer
+    debug_enabled = logger.isEnabledFor
+    is_disconnected = disconnected.is_set
 
     def wake_consumer() -> None:
+        nonlocal consumer_woken
+        if consumer_woken:
+            return
         try:
             queue.put_nowait(None)
-        except Exception:
-            pass
+        except asyncio.QueueFull:
+            # The consumer must see the sentinel; give up the oldest line instead
+            try:
+                queue.get_nowait()
+            except asyncio.QueueEmpty:
+                pass
+            logger.warning("Receive queue full on disconnect, dropped oldest line")
+            queue.put_nowait(None)
+        consumer_woken = True
 
-    def handle(data: bytearray) -> None:
-        logger.debug("Notification received: %d bytes", len(data))
-        buffer.extend(data)
+    def handle(_: BleakGATTCharacteristic, data: bytearray) -> None:
+        nonlocal dropped_lines
+        if debug_enabled(logging.DEBUG):
+            logger.debug("Notification received: %d bytes", len(data))
+        extend_buffer(data)
 
         # Parse accumulated data into complete lines
         while True:
-            text = _parse_line_from_buffer(buffer, debug_hex_dumped)
+            text = parse_line(state)
             if text is None:
                 break
-            queue.put_nowait(text)
+            try:
+                put_line(text)
+            except asyncio.QueueFull:
+                if not dropped_lines:
+                    logger.warning(
+                        "Receive queue full (%d lines), dropping new lines",
+                        queue.maxsize,
+                    )
+                dropped_lines += 1
+                continue
+            if dropped_lines:
+                logger.warning(
+                    "Receive queue drained, %d lines were dropped", dropped_lines
+                )
+                dropped_lines = 0
 
         # Wake consumer on disconnect in case reception becomes intermittent
-        if disconnected.is_set():
+        if is_disconnected():
             wake_consumer()
 
     return handle
@@ -1331,7 +1581,7 @@ async def _process_message_queue(
     idle_timeout: Optional[float],
     disconnected: asyncio.Event,
     client: BleakClient,
-) -> AsyncIterator[ImuRow]:
+) -> AsyncIterator[list[ImuRow]]:
     """Process BLE message queue with timeout handling and connection monitoring.
 
     This function implements the consumer side of a producer-consumer pattern for BLE data.
@@ -1350,6 +1600,10 @@ async def _process_message_queue(
     4. **Sentinel Handling**: Recognizes None as a disconnection signal from the producer,
        enabling clean shutdown coordination.
 
+    5. **Batch Draining**: After each awaited message, every message already queued is
+       taken synchronously, so bursts cost a single event-loop wakeup and are
+       yielded together as one list.
+
     Args:
         queue: Message queue containing raw CSV strings from BLE notifications
         idle_timeout: Maximum seconds to wait for messages before checking connection.
@@ -1358,7 +1612,8 @@ async def _process_message_queue(
         client: BLE client for connection status verification
 
     Yields:
-        ImuRow: Successfully parsed sensor data rows
+        list[ImuRow]: Successfully parsed sensor data rows of one burst, oldest
+            first. Bursts without any valid row are not yielded.
 
     Raises:
         RuntimeError: When BLE connection is lost or timeout occurs on disconnected client
@@ -1367,13 +1622,19 @@ async def _process_message_queue(
         This function is designed to be resilient to temporary communication issues
         while failing fast on permanent connection loss.
     """
+    # Checked once per connection: the wait logs below would otherwise cost a
+    # call per received burst even with DEBUG disabled
+    debug = logger.isEnabledFor(logging.DEBUG)
+
     while True:
         # Apply idle timeout if configured
         if idle_timeout is not None:
             try:
-                logger.debug("Waiting for queue (timeout=%.1fs)", idle_timeout)
+                if debug:
+                    logger.debug("Waiting for queue (timeout=%.1fs)", idle_timeout)
                 line = await asyncio.wait_for(queue.get(), timeout=idle_timeout)
-                logger.debug("Queue item received: %r", line)
+                if debug:
+                    logger.debug("Queue item received: %r", line)
             except asyncio.TimeoutError:
                 # Timeout occurred - exit if disconnected, otherwise continue waiting
                 logger.warning("Receive timeout (%.1fs)", idle_timeout)
@@ -1382,24 +1643,89 @@ async def _process_message_queue(
                 else:
                     continue
         else:
-            logger.debug("Waiting for queue (indefinite)")
+            if debug:
+                logger.debug("Waiting for queue (indefinite)")
             line = await queue.get()
-            logger.debug("Queue item received: %r", line)
+            if debug:
+                logger.debug("Queue item received: %r", line)
 
-        if line is None:
-            # Disconnection sentinel
-            raise RuntimeError("BLE connection lost.")
-        if not line:
-            logger.debug("Skipping empty line")
-            continue
+        # A notification often completes several lines at once; take every
+        # line already queued without going back through the event loop
+        lines = [line]
+        while True:
+            try:
+                lines.append(queue.get_nowait())
+            except asyncio.QueueEmpty:
+                break
+
+        rows: list[ImuRow] = []
+        for line in lines:
+            if line is None:
+                # Disconnection sentinel; hand over the rows parsed before it
+                if rows:
+                    yield rows
+                raise RuntimeError("BLE connection lost.")
+            if not line:
+                logger.debug("Skipping empty line")
+                continue
+
+            try:
+                rows.append(ImuRow.parse_csv(line))
+            except Exception as ex:
+                # Skip conversion failures (log for debugging)
+                logger.warning("CSV parsing failed: %s (error=%s)", line, ex)
+        if rows:
+            yield rows
+
+
+async def _stream_row_batches(
+    address: Optional[str],
+    device_name: str,
+    service_uuid: str,
+    tx_char_uuid: str,
+    scan_timeout: float,
+    idle_timeout: Optional[float],
+) -> AsyncIterator[list[ImuRow]]:
+    """Connect to the device and yield its rows one received burst at a time.
+
+    Shared implementation of stream_rows(), stream_batches() and
+    print_stream(); see stream_rows() for the arguments.
+    """
+    address = await _get_device_address(
+        address, device_name, service_uuid, scan_timeout
+    )
+
+    state = _ParseState()
+
+    # Disconnect notification callback
+    disconnected = asyncio.Event()
+
+    def on_disconnect(_: BleakClient) -> None:
+        logger.warning("BLE connection lost (callback)")
+        disconnected.set()
+
+    logger.info("BLE connection starting: %s", address)
+    async with BleakClient(address, disconnected_callback=on_disconnect) as client:
+        if not client.is_connected:
+            raise RuntimeError("BLE connection failed.")
+        logger.info("BLE connection established: %s", address)
+
+        # Queue for receiving data lines. Send None on disconnect to signal termination.
+        queue: asyncio.Queue[Optional[str]] = asyncio.Queue(LINE_QUEUE_MAXSIZE)
+
+        handle = _create_notification_handler(queue, state, disconnected)
+
+        logger.info("Starting notification subscription: char=%s", tx_char_uuid)
+        await client.start_notify(tx_char_uuid, handle)
 
         try:
-            row = ImuRow.parse_csv(line)
-            yield row
-        except Exception as ex:
-            # Skip conversion failures (log for debugging)
-            logger.warning("CSV parsing failed: %s (error=%s)", line, ex)
-            continue
+            async for rows in _process_message_queue(
+                queue, idle_timeout, disconnected, client
+            ):
+                yield rows
+        finally:
+            logger.info("Stopping notification subscription")
+            await client.stop_notify(tx_char_uuid)
 
 
 async def stream_rows(
@@ -1454,48 +1780,71 @@ async def stream_rows(
     Note:
         This function is designed to be the primary entry point for BLE data collection.
         It handles all low-level BLE complexity while providing a simple async iterator
-        interface for consuming applications.
+        interface for consuming applications. Consumers that process samples
+        as NumPy arrays should use stream_batches() instead.
     """
+    async for rows in _stream_row_batches(
+        address, device_name, service_uuid, tx_char_uuid, scan_timeout, idle_timeout
+    ):
+        for row in rows:
+            yield row
 
-    address = await _get_device_address(
-        address, device_name, service_uuid, scan_timeout
-    )
 
-    buffer = bytearray()
-    # Debug: One-time HEX preview when buffer grows without finding delimiters
-    debug_hex_dumped = {"dumped": False}
+async def stream_batches(
+    address: Optional[str] = None,
+    *,
+    device_name: str = DEVICE_NAME,
+    service_uuid: str = NUS_SERVICE,
+    tx_char_uuid: str = NUS_TX_CHAR,
+    scan_timeout: float = 10.0,
+    idle_timeout: Optional[float] = None,
+    batch_size: int = 64,
+) -> AsyncIterator[tuple[np.ndarray, np.ndarray]]:
+    """Stream IMU sensor data from the device as NumPy array batches.
+
+    Same connection handling as stream_rows(), but the rows are delivered as
+    arrays so that plotting or FFT code does not have to loop over ImuRow
+    objects in Python. Each batch holds the rows that arrived together in one
+    burst of notifications, so no row is held back waiting for a batch to
+    fill up; bursts longer than batch_size are split.
 
-    # Disconnect notification callback
-    disconnected = asyncio.Event()
+    Args:
+        address: Specific BLE device address. If None, performs automatic discovery.
+        device_name: Device name filter for discovery (default: "XIAO Sense IMU")
+        service_uuid: Target BLE service UUID (default: Nordic UART Service)
+        tx_char_uuid: TX characteristic UUID for notifications
+        scan_timeout: Maximum seconds to spend on device discovery
+        idle_timeout: Maximum seconds to wait between messages before checking
+                     connection. None for indefinite waiting.
+        batch_size: Maximum number of rows per batch.
 
-    def on_disconnect(_: BleakClient) -> None:
-        logger.warning("BLE connection lost (callback)")
-        disconnected.set()
+    Yields:
+        tuple[np.ndarray, np.ndarray]: ``(millis, data)`` where millis is an
+            int64 array of shape (n,) and data is a float64 array of shape
+            (n, 8) holding the remaining IMU_COLUMNS (ax ... audioRMS) in order.
 
-    logger.info("BLE connection starting: %s", address)
-    async with BleakClient(address, disconnected_callback=on_disconnect) as client:
-        if not client.is_connected:
-            raise RuntimeError("BLE connection failed.")
-        logger.info("BLE connection established: %s", address)
+    Raises:
+        ValueError: If batch_size is not positive
+        RuntimeError: On connection failure or communication timeout
+        DeviceNotFoundError: When target device cannot be located during discovery
 
-        # Queue for receiving data lines. Send None on disconnect to signal termination.
-        queue: asyncio.Queue[Optional[str]] = asyncio.Queue()
+    Example:
+        >>> async for millis, data in stream_batches(idle_timeout=30.0):
+        ...     accel_norm = np.linalg.norm(data[:, 0:3], axis=1)
+    """
+    if batch_size <= 0:
+        raise ValueError(f"batch_size must be positive: {batch_size}")
 
-        handle = _create_notification_handler(
-            queue, buffer, debug_hex_dumped, disconnected
-        )
+    async for rows in _stream_row_batches(
+        address, device_name, service_uuid, tx_char_uuid, scan_timeout, idle_timeout
+    ):
+        for start in range(0, len(rows), batch_size):
+            block = np.array(rows[start : start + batch_size], dtype=np.float64)
+            yield block[:, 0].astype(np.int64), block[:, 1:]
 
-        logger.info("Starting notification subscription: char=%s", tx_char_uuid)
-        await client.start_notify(tx_char_uuid, lambda _, data: handle(data))
 
-        try:
-            async for row in _process_message_queue(
-                queue, idle_timeout, disconnected, client
-            ):
-                yield row
-        finally:
-            logger.info("Stopping notification subscription")
-            await client.stop_notify(tx_char_uuid)
+# print_stream() row format; ImuRow is a tuple in this field order
+_STDOUT_CSV_FORMAT = "%d,%.6f,%.6f,%.6f,%.6f,%.6f,%.6f,%.2f,%.2f\n"
 
 
 async def print_stream(
@@ -1539,19 +1888,25 @@ async def print_stream(
     if show_header:
         logger.info("CSV header: millis,ax,ay,az,gx,gy,gz,tempC,audioRMS")
         print("millis,ax,ay,az,gx,gy,gz,tempC,audioRMS")
-    async for r in stream_rows(
-        address,
-        device_name=device_name,
-        scan_timeout=scan_timeout,
-        idle_timeout=idle_timeout,
+    write = sys.stdout.write
+    async for rows in _stream_row_batches(
+        address, device_name, NUS_SERVICE, NUS_TX_CHAR, scan_timeout, idle_timeout
     ):
-        if drop_missing_audio and r.audioRMS < 0:
-            logger.debug("Skipping row due to missing audioRMS: millis=%d", r.millis)
+        if drop_missing_audio:
+            kept = [r for r in rows if r.audioRMS >= 0]
+            if len(kept) < len(rows):
+                logger.debug(
+                    "Skipping %d rows due to missing audioRMS", len(rows) - len(kept)
+                )
+            rows = kept
+        if not rows:
             continue
-        # Input format may vary, but standardize output precision for consistency
-        csv_line = f"{r.millis},{r.ax:.6f},{r.ay:.6f},{r.az:.6f},{r.gx:.6f},{r.gy:.6f},{r.gz:.6f},{r.tempC:.2f},{r.audioRMS:.2f}"
-        logger.debug("CSV output: %s", csv_line)
-        print(csv_line)
+        # Input format may vary, but standardize output precision for consistency;
+        # each burst is formatted and written in one go
+        csv_text = "".join([_STDOUT_CSV_FORMAT % r for r in rows])
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("CSV output: %s", csv_text.rstrip("\n"))
+        write(csv_text)
 
 
 def run(
@@ -1597,7 +1952,8 @@ def run(
             130: Keyboard interrupt (SIGINT/Ctrl+C)
 
     Note:
-        This function is designed for CLI usage and blocking operation.
+        This function is designed for CLI usage and blocking operation. The
+        event loop is uvloop's when the optional package is installed.
         For integration into larger applications, use the async print_stream()
         function directly or the DataSource classes for more control.
 
@@ -1614,7 +1970,9 @@ def run(
                 device_name=device_name,
                 scan_timeout=scan_timeout,
                 idle_timeout=idle_timeout,
-            )
+            ),
+            # Cheaper per-callback scheduling for notifications and queue wakeups
+            loop_factory=uvloop.new_event_loop if uvloop is not None else None,
         )
         return 0
     except KeyboardInterrupt:
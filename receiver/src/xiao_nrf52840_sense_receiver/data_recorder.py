@@ -6,21 +6,55 @@ This module implements real-time data recording capabilities including:
 - RecorderManager: Coordinates recording sessions and file management
 
 Architecture follows design doc: data collection must NEVER be blocked by recording.
+
+Compressed recordings (``compression="zstd"``) require the optional
+``zstandard`` package (``uv sync --extra zstd``).
 """
 
 import json
 import logging
 import os
+import queue
+import struct
 import threading
+import time
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import List, Optional, TextIO
+from typing import BinaryIO, List, Optional, Union
 
 from .ble_receiver import DataBuffer, ImuRow
 
+try:
+    import zstandard
+except ImportError:  # Optional dependency, only needed for compressed output
+    zstandard = None  # type: ignore[assignment]
+
 logger = logging.getLogger(__name__)
 
+CSV_HEADER = "millis,ax,ay,az,gx,gy,gz,tempC,audioRMS\n"
+
+# Binary spool record: millis as int64 followed by the 8 float values. float64
+# keeps the spool lossless, so the transcoded CSV matches direct CSV output.
+_SPOOL_ROW = struct.Struct("<q8d")
+_SPOOL_CSV_ROW = "%d,%.6f,%.6f,%.6f,%.6f,%.6f,%.6f,%.2f,%.3f\n"
+
+# Encoded chunk handed from RecordFileWriter to the flusher thread
+_Chunk = Union[bytes, memoryview]
+
+# Upper bound on buffers per writev() call (Linux/macOS IOV_MAX is 1024)
+_WRITEV_MAX_BUFFERS = 64
+
+# Seconds RecorderManager waits for the recording worker to exit
+WORKER_STOP_TIMEOUT = 5.0
+
+# Seconds RecordFileWriter.close() waits for the flusher to write what is queued
+FLUSHER_STOP_TIMEOUT = 5.0
+
+# Seconds between forced flushes of a recording in progress. Each one fsyncs
+# and drops the synced pages from the page cache (see RecordFileWriter.flush)
+FSYNC_INTERVAL = 10.0
+
 
 @dataclass
 class RecordingStatus:
@@ -48,21 +82,194 @@ class SessionInfo:
     file_size_bytes: int
 
 
+class _FlushThread(threading.Thread):
+    """Background thread that writes encoded chunks to the recording file.
+
+    The producer hands over complete chunks through a SimpleQueue, so formatting
+    the next chunk overlaps with the disk write of the previous one. A
+    threading.Event placed in the queue acts as a barrier: it is set once every
+    chunk queued before it has been written. None stops the thread. Ownership
+    of a submitted chunk passes to this thread, so buffers are handed over
+    without copying.
+
+    Chunks that pile up while a write is in flight are drained together and,
+    for uncompressed files, submitted with a single os.writev() call instead
+    of one write per chunk.
+
+    Once started, the thread owns the file: it closes the handle itself after
+    the stop sentinel. os.writev() addresses the file by descriptor number, so
+    closing it from another thread while a write is still pending could let a
+    newly opened file reuse that number and receive the late write.
+    """
+
+    def __init__(self, file_handle: BinaryIO, vectored: bool = False):
+        super().__init__(daemon=True, name="RecordingFlusher")
+        self._file_handle = file_handle
+        # writev bypasses the file object, so it needs a raw OS-level fd. Only
+        # run() closes the file, so the number cannot be reused by another
+        # open() while a write on it is still pending.
+        self._fd: Optional[int] = None
+        if vectored and hasattr(os, "writev"):
+            self._fd = file_handle.fileno()
+        self._queue: "queue.SimpleQueue[Union[_Chunk, threading.Event, None]]" = (
+            queue.SimpleQueue()
+        )
+        self._error: Optional[Exception] = None
+
+    def submit(self, chunk: _Chunk) -> None:
+        """Queue an encoded chunk for writing."""
+        self._queue.put(chunk)
+
+    def wait_written(self, timeout: Optional[float] = None) -> bool:
+        """Block until every chunk queued so far has been written."""
+        done = threading.Event()
+        self._queue.put(done)
+        return done.wait(timeout)
+
+    def stop(self, timeout: float = 5.0) -> bool:
+        """Write remaining chunks, close the file and stop the thread.
+
+        Returns:
+            True if the thread has exited (and closed the file), False if it
+            is still writing after the timeout. It then closes the file itself
+            once its pending writes finish.
+        """
+        self._queue.put(None)
+        self.join(timeout=timeout)
+        if self.is_alive():
+            logger.warning("Recording flusher thread did not stop gracefully")
+            return False
+        return True
+
+    def run(self) -> None:
+        """Write queued chunks until the stop sentinel arrives, then close."""
+        try:
+            self._write_until_stopped()
+        finally:
+            try:
+                self._file_handle.close()
+            except Exception as e:
+                logger.error(f"Error closing recording file: {e}")
+                if self._error is None:
+                    self._error = e
+
+    def _write_until_stopped(self) -> None:
+        """Drain the queue in batches until the stop sentinel arrives."""
+        running = True
+        while running:
+            batch: List[_Chunk] = []
+            item = self._queue.get()
+            # Drain everything already queued so it goes out in one batch
+            while True:
+                if item is None:
+                    running = False
+                    break
+                if isinstance(item, threading.Event):
+                    self._write_batch(batch)
+                    batch = []
+                    item.set()
+                else:
+                    batch.append(item)
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+            self._write_batch(batch)
+
+    def _write_batch(self, batch: List[_Chunk]) -> None:
+        """Write a batch of chunks, recording the first error encountered."""
+        if not batch or self._error is not None:
+            return  # Drop data after a failed write, keep serving barriers
+        try:
+            if self._fd is not None:
+                self._writev_all(self._fd, batch)
+            else:
+                # No flush(): the file object drains its own buffer when full,
+                # and flush()/close() on the writer force it out when needed
+                for chunk in batch:
+                    self._file_handle.write(chunk)
+        except Exception as e:
+            logger.error(f"Error flushing data to file: {e}")
+            self._error = e
+
+    @staticmethod
+    def _writev_all(fd: int, batch: List[_Chunk]) -> None:
+        """Write every chunk with os.writev, resuming after partial writes."""
+        views = [memoryview(chunk) for chunk in batch]
+        while views:
+            written = os.writev(fd, views[:_WRITEV_MAX_BUFFERS])
+            while views and written >= len(views[0]):
+                written -= len(views[0])
+                views.pop(0)
+            if written:
+                views[0] = views[0][written:]
+
+    @property
+    def error(self) -> Optional[Exception]:
+        """Get any error that occurred while writing."""
+        return self._error
+
+
 class RecordFileWriter:
     """Handles synchronous CSV file operations with internal buffering.
 
     Design principle: Use simple, reliable synchronous I/O with internal buffering
     to avoid blocking the data collection thread while maintaining data integrity.
+
+    With compression="zstd" the CSV is streamed through a zstd compressor and
+    written as "<name>.csv.zst". IMU rows are highly redundant text, so this
+    cuts the bytes reaching the disk several-fold at a small CPU cost. If
+    zstandard is not installed the writer falls back to plain CSV.
+
+    Completed buffers are written by a dedicated flusher thread, so the
+    recording worker keeps draining samples while the previous chunk is on its
+    way to disk.
+
+    With binary_spool=True rows are packed into a fixed-size binary spool file
+    during the session instead of being formatted as text. close() hands the
+    spool to a background thread that transcodes it to the final CSV
+    (compressed if configured) and then writes the metadata file, so neither
+    the recording path nor the caller of close() pays for CSV formatting. If
+    transcoding fails the ".spool" file is kept so the data can be recovered.
+
+    Threading contract: append_rows(), flush() and close() are called by a
+    single producer: the recording worker, or the manager once the worker has
+    exited. A worker that does not exit in time closes the writer itself when
+    it finishes (see RecordingWorkerThread.defer_close()). Buffers are handed
+    to the flusher by swapping in a fresh one, so no lock is taken on the
+    append path. samples_written may be read from any thread.
     """
 
-    def __init__(self, filepath: Path, buffer_size: int = 100):
-        self._filepath = filepath
+    def __init__(
+        self,
+        filepath: Path,
+        buffer_size: int = 100,
+        compression: Optional[str] = None,
+        binary_spool: bool = False,
+    ):
+        if compression not in (None, "zstd"):
+            raise ValueError(f"Unsupported compression: {compression}")
+        if compression == "zstd" and zstandard is None:
+            logger.warning("zstandard is not installed; recording uncompressed CSV")
+            compression = None
+
+        self._session_id = filepath.stem
+        self._metadata_path = filepath.with_suffix(".meta.json")
+        self._compression = compression
+        self._filepath = (
+            filepath.with_name(filepath.name + ".zst") if compression else filepath
+        )
         self._buffer_size = buffer_size  # Flush every N rows (~4 seconds at 25Hz)
         self._write_buffer: List[str] = []
-        self._file_handle: Optional[TextIO] = None
+        self._spool_path = filepath.with_name(filepath.name + ".spool")
+        self._binary_spool = binary_spool
+        self._spool = bytearray(_SPOOL_ROW.size * buffer_size if binary_spool else 0)
+        self._spool_offset = 0
+        self._file_handle: Optional[BinaryIO] = None
+        self._flusher: Optional[_FlushThread] = None
+        self._transcoder: Optional[threading.Thread] = None
         self._sample_count = 0
         self._start_time = datetime.now(timezone.utc)
-        self._lock = threading.Lock()
 
     def open(self) -> None:
         """Open file for writing with CSV header."""
@@ -70,12 +277,32 @@ class RecordFileWriter:
             # Ensure parent directory exists
             self._filepath.parent.mkdir(parents=True, exist_ok=True)
 
-            self._file_handle = open(self._filepath, "w", newline="", encoding="utf-8")
+            if self._binary_spool:
+                # Header is written when the spool is transcoded on close
+                self._file_handle = open(self._spool_path, "wb")
+            else:
+                self._file_handle = self._open_sink()
 
-            # Write CSV header matching existing output format exactly
-            header = "millis,ax,ay,az,gx,gy,gz,tempC,audioRMS\n"
-            self._file_handle.write(header)
-            self._file_handle.flush()  # Ensure header is written immediately
+                # Write CSV header matching existing output format exactly
+                self._file_handle.write(CSV_HEADER.encode("utf-8"))
+                self._file_handle.flush()  # Ensure header is written immediately
+
+            # Hint append-only access so the kernel can tune write-behind
+            if hasattr(os, "posix_fadvise"):
+                try:
+                    os.posix_fadvise(
+                        self._file_handle.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL
+                    )
+                except OSError as e:
+                    logger.debug(f"posix_fadvise(SEQUENTIAL) failed: {e}")
+
+            # Plain files are written with writev; the zstd stream must see
+            # every byte through its own write() to compress it
+            self._flusher = _FlushThread(
+                self._file_handle,
+                vectored=self._binary_spool or self._compression is None,
+            )
+            self._flusher.start()
 
             logger.info(f"Opened recording file: {self._filepath}")
 
@@ -83,21 +310,49 @@ class RecordFileWriter:
             logger.error(f"Failed to open recording file {self._filepath}: {e}")
             raise
 
+    def _open_sink(self) -> BinaryIO:
+        """Open the binary output stream, wrapping it in a compressor if enabled."""
+        raw = open(self._filepath, "wb")
+        if self._compression == "zstd" and zstandard is not None:
+            compressor = zstandard.ZstdCompressor(level=3, threads=1)
+            # The stream writer honors write()/flush()/fileno() and closes raw
+            return compressor.stream_writer(raw)
+        return raw
+
     def append_rows(self, samples: List[ImuRow]) -> None:
         """Add samples to write buffer."""
         if not self._file_handle:
             raise RuntimeError("File not open for writing")
 
-        with self._lock:
-            # Format samples as CSV lines matching existing format exactly
-            for sample in samples:
-                csv_line = self._format_csv_row(sample)
-                self._write_buffer.append(csv_line)
-                self._sample_count += 1
+        if self._binary_spool:
+            self._append_binary(samples)
+            return
+
+        # Format samples as CSV lines matching existing format exactly
+        for sample in samples:
+            csv_line = self._format_csv_row(sample)
+            self._write_buffer.append(csv_line)
+            self._sample_count += 1
+
+        # Flush when buffer is full (every ~4 seconds at 25Hz)
+        if len(self._write_buffer) >= self._buffer_size:
+            self._flush_internal()
+
+    def _append_binary(self, samples: List[ImuRow]) -> None:
+        """Pack samples into the preallocated binary spool buffer."""
+        spool = self._spool
+        pack_into = _SPOOL_ROW.pack_into
+        row_size = _SPOOL_ROW.size
+        for sample in samples:
+            # ImuRow is a named tuple in _SPOOL_ROW field order
+            pack_into(spool, self._spool_offset, *sample)
+            self._spool_offset += row_size
+            self._sample_count += 1
 
             # Flush when buffer is full (every ~4 seconds at 25Hz)
-            if len(self._write_buffer) >= self._buffer_size:
+            if self._spool_offset >= len(spool):
                 self._flush_internal()
+                spool = self._spool  # Swapped for a fresh buffer
 
     def _format_csv_row(self, sample: ImuRow) -> str:
         """Format sample as CSV row matching existing output format."""
@@ -108,80 +363,179 @@ class RecordFileWriter:
         )
 
     def _flush_internal(self) -> None:
-        """Internal flush without additional locking."""
-        if not self._write_buffer or not self._file_handle:
+        """Hand buffered rows to the flusher thread by swapping buffers."""
+        if not self._flusher:
             return
+        if self._flusher.error is not None:
+            raise self._flusher.error
+        if self._binary_spool:
+            if not self._spool_offset:
+                return
+            spool, self._spool = self._spool, bytearray(len(self._spool))
+            self._flusher.submit(memoryview(spool)[: self._spool_offset])
+            self._spool_offset = 0
+        else:
+            if not self._write_buffer:
+                return
+            rows, self._write_buffer = self._write_buffer, []
+            self._flusher.submit("".join(rows).encode("utf-8"))
+
+    def _transcode_spool(self) -> None:
+        """Convert the binary spool into the final CSV file and remove it."""
+        row_size = _SPOOL_ROW.size
+        block_size = row_size * 4096
+        with open(self._spool_path, "rb") as src, self._open_sink() as dst:
+            dst.write(CSV_HEADER.encode("utf-8"))
+            while block := src.read(block_size):
+                # Ignore a torn trailing record rather than failing the session
+                block = block[: len(block) - len(block) % row_size]
+                text = "".join(
+                    _SPOOL_CSV_ROW % row for row in _SPOOL_ROW.iter_unpack(block)
+                )
+                dst.write(text.encode("utf-8"))
+        self._spool_path.unlink()
 
+    def _finish_spool(self, end_time: datetime, duration: float) -> None:
+        """Transcode the closed spool and write the metadata (transcoder thread)."""
         try:
-            # Synchronous write (simple and reliable)
-            self._file_handle.writelines(self._write_buffer)
-            self._write_buffer.clear()
-            self._file_handle.flush()  # Ensure data reaches disk
-
+            self._transcode_spool()
+            file_size = self._filepath.stat().st_size
         except Exception as e:
-            logger.error(f"Error flushing data to file: {e}")
-            raise
+            logger.error(
+                f"Failed to transcode {self._spool_path}; spool file kept: {e}"
+            )
+            return
+        self._write_metadata_file(end_time, duration, file_size)
+        logger.info(f"Transcoded recording spool to {self._filepath}")
+
+    def wait_transcoded(self, timeout: Optional[float] = None) -> bool:
+        """Wait for the spool transcoding started by close() to finish.
+
+        Args:
+            timeout: Maximum seconds to wait. None waits indefinitely.
+
+        Returns:
+            True if no transcoding is pending (or the writer never spooled),
+            False if the timeout expired first.
+        """
+        if self._transcoder is None:
+            return True
+        self._transcoder.join(timeout)
+        return not self._transcoder.is_alive()
 
     def flush(self, force_fsync: bool = False) -> None:
-        """Write buffered data to disk."""
-        with self._lock:
-            self._flush_internal()
+        """Hand buffered rows to the flusher, optionally forcing them to disk.
+
+        Without force_fsync the rows are only queued for writing; the file
+        object's own buffer is left to drain when full. With force_fsync the
+        call waits for queued chunks, flushes the file object and fsyncs.
+
+        When force_fsync is set, the synced pages are also released from the
+        page cache. A recording is write-only, so keeping its clean pages
+        cached only evicts pages that other processes still need. The
+        recording worker forces a flush every FSYNC_INTERVAL seconds and
+        close() forces a final one, so long sessions do not fill the cache.
+        """
+        self._flush_internal()
 
-            if force_fsync and self._file_handle:
+        if force_fsync and self._file_handle and self._flusher:
+            try:
+                if not self._flusher.wait_written(FLUSHER_STOP_TIMEOUT):
+                    logger.warning("Recording flusher is stalled; fsync skipped")
+                    return
+                self._file_handle.flush()
+                fd = self._file_handle.fileno()
+                os.fsync(fd)
+            except Exception as e:
+                logger.warning(f"fsync failed: {e}")
+                return
+
+            # Only a cache hint: the data is already on disk at this point
+            if hasattr(os, "posix_fadvise"):
                 try:
-                    os.fsync(self._file_handle.fileno())
-                except Exception as e:
-                    logger.warning(f"fsync failed: {e}")
+                    os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+                except OSError as e:
+                    logger.debug(f"posix_fadvise(DONTNEED) failed: {e}")
 
     def close(self) -> SessionInfo:
-        """Close file and write metadata."""
-        with self._lock:
-            if not self._file_handle:
-                raise RuntimeError("File not open")
+        """Close file and write metadata.
 
-            try:
-                # Flush any remaining data
-                self._flush_internal()
-                self._file_handle.close()
+        In binary spool mode this returns as soon as the spool is closed; the
+        CSV file and its metadata are produced by a background thread (see
+        wait_transcoded()). The thread is not a daemon, so interpreter
+        shutdown waits for it. The returned file_size_bytes is then the size
+        of the spool, as the final file does not exist yet.
+        """
+        if not self._file_handle:
+            raise RuntimeError("File not open")
 
-                end_time = datetime.now(timezone.utc)
-                duration = (end_time - self._start_time).total_seconds()
+        flusher = self._flusher
+        try:
+            try:
+                # Write out remaining data, sync it and drop it from the cache
+                self.flush(force_fsync=True)
+            finally:
+                # The flusher closes the file once it has written everything,
+                # also after a failed write, so the descriptor is not leaked
+                if flusher is None:
+                    self._file_handle.close()
+                elif not flusher.stop(timeout=FLUSHER_STOP_TIMEOUT):
+                    raise RuntimeError(
+                        "Recording flusher did not stop in time; "
+                        "the file is closed when its pending writes finish"
+                    )
+            if flusher and flusher.error is not None:
+                raise flusher.error
+
+            end_time = datetime.now(timezone.utc)
+            duration = (end_time - self._start_time).total_seconds()
+
+            if self._binary_spool:
+                # Formatting a long session takes a while; keep it off the
+                # caller, which is typically a UI callback
+                file_size = self._spool_path.stat().st_size
+                self._transcoder = threading.Thread(
+                    target=self._finish_spool,
+                    args=(end_time, duration),
+                    name="RecordingTranscoder",
+                )
+                self._transcoder.start()
+            else:
                 file_size = self._filepath.stat().st_size
 
                 # Write metadata file
                 self._write_metadata_file(end_time, duration, file_size)
 
-                session_info = SessionInfo(
-                    session_id=self._filepath.stem,
-                    start_time=self._start_time,
-                    end_time=end_time,
-                    duration_seconds=duration,
-                    total_samples=self._sample_count,
-                    file_path=self._filepath,
-                    file_size_bytes=file_size,
-                )
+            session_info = SessionInfo(
+                session_id=self._session_id,
+                start_time=self._start_time,
+                end_time=end_time,
+                duration_seconds=duration,
+                total_samples=self._sample_count,
+                file_path=self._filepath,
+                file_size_bytes=file_size,
+            )
 
-                logger.info(
-                    f"Closed recording: {self._sample_count} samples, "
-                    f"{duration:.1f}s, {file_size} bytes"
-                )
+            logger.info(
+                f"Closed recording: {self._sample_count} samples, "
+                f"{duration:.1f}s, {file_size} bytes"
+            )
 
-                return session_info
+            return session_info
 
-            except Exception as e:
-                logger.error(f"Error closing recording file: {e}")
-                raise
-            finally:
-                self._file_handle = None
+        except Exception as e:
+            logger.error(f"Error closing recording file: {e}")
+            raise
+        finally:
+            self._file_handle = None
+            self._flusher = None
 
     def _write_metadata_file(
         self, end_time: datetime, duration: float, file_size: int
     ) -> None:
         """Write companion metadata file."""
-        metadata_path = self._filepath.with_suffix(".meta.json")
-
         metadata = {
-            "session_id": self._filepath.stem,
+            "session_id": self._session_id,
             "start_time": self._start_time.isoformat(),
             "end_time": end_time.isoformat(),
             "duration_seconds": duration,
@@ -192,11 +546,15 @@ class RecordFileWriter:
             "file_path": str(self._filepath),
             "file_size_bytes": file_size,
             "device_info": {"name": "XIAO Sense IMU", "connection_type": "BLE"},
-            "recording_settings": {"buffer_size": self._buffer_size},
+            "recording_settings": {
+                "buffer_size": self._buffer_size,
+                "compression": self._compression,
+                "binary_spool": self._binary_spool,
+            },
         }
 
         try:
-            with open(metadata_path, "w", encoding="utf-8") as f:
+            with open(self._metadata_path, "w", encoding="utf-8") as f:
                 json.dump(metadata, f, indent=2)
         except Exception as e:
             logger.warning(f"Failed to write metadata file: {e}")
@@ -204,15 +562,17 @@ class RecordFileWriter:
     @property
     def samples_written(self) -> int:
         """Get number of samples written to file."""
-        with self._lock:
-            return self._sample_count
+        return self._sample_count
 
     @property
     def file_size_bytes(self) -> int:
         """Get current file size."""
+        path = self._filepath
+        if self._binary_spool and self._file_handle is not None:
+            path = self._spool_path  # Final file only exists after transcoding
         try:
-            if self._filepath.exists():
-                return self._filepath.stat().st_size
+            if path.exists():
+                return path.stat().st_size
         except Exception:
             pass
         return 0
@@ -222,7 +582,8 @@ class RecordingWorkerThread(threading.Thread):
     """Dedicated thread for file writing operations.
 
     Uses timer-based polling to avoid blocking data collection.
-    Polls buffer every ~40ms (25Hz) for new data and writes to file.
+    Polls buffer every ~40ms (25Hz) for new data and writes to file, forcing
+    it to disk every FSYNC_INTERVAL seconds.
     """
 
     def __init__(self, buffer: DataBuffer, file_writer: RecordFileWriter):
@@ -232,6 +593,10 @@ class RecordingWorkerThread(threading.Thread):
         self._last_read_index = 0
         self._stop_event = threading.Event()
         self._error: Optional[Exception] = None
+        # Guards the writer hand-off between this thread and the manager
+        self._handoff_lock = threading.Lock()
+        self._finished = False
+        self._close_on_exit = False
 
     def run(self) -> None:
         """Main worker loop with timer-based polling."""
@@ -240,6 +605,7 @@ class RecordingWorkerThread(threading.Thread):
         try:
             # Initialize read position to current buffer state
             self._last_read_index = self._buffer.current_write_index
+            last_sync = time.monotonic()
 
             while not self._stop_event.is_set():
                 try:
@@ -256,9 +622,12 @@ class RecordingWorkerThread(threading.Thread):
                     if new_samples:
                         self._writer.append_rows(new_samples)
                         self._last_read_index = next_index
+                        logger.debug("Recorded %d samples", len(new_samples))
 
-                        if len(new_samples) > 0:
-                            logger.debug(f"Recorded {len(new_samples)} samples")
+                        now = time.monotonic()
+                        if now - last_sync >= FSYNC_INTERVAL:
+                            self._writer.flush(force_fsync=True)
+                            last_sync = now
 
                     # Timer-based polling: baseline 40ms (25Hz).
                     # If no new data, sleep slightly longer to reduce unnecessary wakeups.
@@ -274,10 +643,23 @@ class RecordingWorkerThread(threading.Thread):
             logger.error(f"Fatal error in recording worker: {e}")
             self._error = e
         finally:
+            with self._handoff_lock:
+                self._finished = True
+                close_writer = self._close_on_exit
+            if close_writer:
+                try:
+                    self._writer.close()
+                except Exception as e:
+                    logger.error(f"Error closing recording after late stop: {e}")
             logger.info("Recording worker thread finished")
 
-    def stop(self, timeout: float = 5.0) -> None:
-        """Stop the recording thread."""
+    def stop(self, timeout: float = 5.0) -> bool:
+        """Stop the recording thread.
+
+        Returns:
+            True if the thread has exited, False if it is still running (for
+            example blocked in a slow disk write) after the timeout.
+        """
         logger.info("Stopping recording worker thread")
         self._stop_event.set()
 
@@ -286,8 +668,26 @@ class RecordingWorkerThread(threading.Thread):
 
             if self.is_alive():
                 logger.warning("Recording worker thread did not stop gracefully")
-            else:
-                logger.info("Recording worker thread stopped")
+                return False
+            logger.info("Recording worker thread stopped")
+        return True
+
+    def defer_close(self) -> bool:
+        """Ask the thread to close its file writer when it exits.
+
+        Used when stop() timed out: the thread may still be inside
+        append_rows(), so closing the writer from another thread would race
+        with it.
+
+        Returns:
+            True if the thread will close the writer, False if it has already
+            exited and the caller must close the writer itself.
+        """
+        with self._handoff_lock:
+            if self._finished:
+                return False
+            self._close_on_exit = True
+            return True
 
     @property
     def error(self) -> Optional[Exception]:
@@ -339,7 +739,13 @@ class RecorderManager:
         single directories.
     """
 
-    def __init__(self, buffer: DataBuffer, output_dir: Path):
+    def __init__(
+        self,
+        buffer: DataBuffer,
+        output_dir: Path,
+        compression: Optional[str] = None,
+        binary_spool: bool = False,
+    ):
         """Initialize recording manager with shared data buffer and output location.
 
         Args:
@@ -348,6 +754,13 @@ class RecorderManager:
                 recording operations.
             output_dir: Base path for recording storage. Directory structure will
                 be created automatically with date-based organization.
+            compression: Optional output compression passed to RecordFileWriter.
+                "zstd" writes "<name>.csv.zst" files to reduce disk bandwidth;
+                None (default) writes plain CSV.
+            binary_spool: When True, samples are spooled in a compact binary
+                format during the session and converted to CSV by a background
+                thread when the recording stops, keeping text formatting off
+                the worker thread and off the caller of stop_recording().
 
         Note:
             The output directory is created immediately to catch permission
@@ -355,6 +768,8 @@ class RecorderManager:
         """
         self._buffer = buffer
         self._output_dir = output_dir
+        self._compression = compression
+        self._binary_spool = binary_spool
         self._worker_thread: Optional[RecordingWorkerThread] = None
         self._file_writer: Optional[RecordFileWriter] = None
         self._is_recording = False
@@ -420,7 +835,11 @@ class RecorderManager:
                 filepath = date_dir / filename
 
                 # Create and open file writer
-                self._file_writer = RecordFileWriter(filepath)
+                self._file_writer = RecordFileWriter(
+                    filepath,
+                    compression=self._compression,
+                    binary_spool=self._binary_spool,
+                )
                 self._file_writer.open()
 
                 # Start worker thread
@@ -461,7 +880,9 @@ class RecorderManager:
                 session including final sample count, file size, and duration.
 
         Raises:
-            RuntimeError: If no recording is currently in progress.
+            RuntimeError: If no recording is currently in progress, or if the
+                worker thread did not stop in time. In the latter case the
+                worker finalizes the file itself once its write completes.
             Various exceptions: Worker thread or file writer errors are
                 logged but don't prevent session finalization.
 
@@ -476,14 +897,22 @@ class RecorderManager:
 
             try:
                 # Stop worker thread
-                if self._worker_thread:
-                    self._worker_thread.stop()
+                owns_writer = self._release_worker()
 
-                    # Check for worker errors
-                    if self._worker_thread.error:
-                        logger.error(
-                            f"Recording worker had error: {self._worker_thread.error}"
-                        )
+                # Check for worker errors
+                if self._worker_thread and self._worker_thread.error:
+                    logger.error(
+                        f"Recording worker had error: {self._worker_thread.error}"
+                    )
+
+                if not owns_writer:
+                    # The worker closes the file itself once it finishes
+                    self._worker_thread = None
+                    self._file_writer = None
+                    raise RuntimeError(
+                        "Recording worker did not stop in time; "
+                        "the file is closed when it finishes"
+                    )
 
                 # Close file writer
                 if self._file_writer:
@@ -507,6 +936,18 @@ class RecorderManager:
                 logger.error(f"Error stopping recording: {e}")
                 raise
 
+    def _release_worker(self) -> bool:
+        """Stop the worker thread and take over its file writer.
+
+        Returns:
+            True if the caller may close the file writer. False if the worker
+            did not exit in time; it then closes the writer itself on exit.
+        """
+        worker = self._worker_thread
+        if worker is None or worker.stop(timeout=WORKER_STOP_TIMEOUT):
+            return True
+        return not worker.defer_close()
+
     def _cleanup_failed_recording(self) -> None:
         """Emergency cleanup for failed recording operations.
 
@@ -523,9 +964,8 @@ class RecorderManager:
             are silently ignored to prevent masking the original failure.
         """
         try:
-            if self._worker_thread:
-                self._worker_thread.stop()
-            if self._file_writer:
+            owns_writer = self._release_worker()
+            if self._file_writer and owns_writer:
                 try:
                     self._file_writer.close()
                 except Exception:
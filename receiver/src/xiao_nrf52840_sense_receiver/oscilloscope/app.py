@@ -1,20 +1,125 @@
 """
 Dash application for oscilloscope visualization.
+
+Callback responses are serialized with orjson when the optional ``orjson``
+package is installed (``uv sync --extra fast-json``), which Plotly's default
+"auto" JSON engine picks up without any configuration, and the data collection
+thread runs on uvloop when ``uvloop`` is installed (``uv sync --extra
+fast-loop``, not available on Windows).
 """
 
 import asyncio
+import functools
 import logging
+import math
 import threading
-from typing import Any, List, Optional, Tuple
+from collections import deque
+from typing import Any, Dict, List, Optional, Tuple
 
 import dash  # type: ignore
-from dash import dcc, html, Input, Output
-
-from ..ble_receiver import DataBuffer, DataSource
-from .plots import create_multi_plot_layout
+from dash import ClientsideFunction, dcc, html, Input, Output, State
+from dash.exceptions import PreventUpdate
+
+try:
+    import uvloop
+except ImportError:  # Optional dependency
+    uvloop = None  # type: ignore[assignment]
+
+from ..ble_receiver import (
+    BleDataSource,
+    DataBuffer,
+    DataSource,
+    ImuRow,
+    MockDataSource,
+)
+from .plots import create_multi_plot_layout, create_plot_patch
 
 logger = logging.getLogger(__name__)
 
+# Seconds between batched flushes of received rows into the DataBuffer
+INGEST_DRAIN_INTERVAL = 0.02
+
+# Seconds the collection worker waits for data_source.stop() during cleanup
+DATA_SOURCE_STOP_TIMEOUT = 2.0
+
+# Upper bound on points drawn per trace; longer windows are min/max bucketed
+MAX_PLOT_POINTS = 400
+
+# Refresh period of the recording duration/size display while recording
+RECORDING_STATUS_INTERVAL_MS = 1000
+
+# Plot refresh periods used instead of update_interval when there is nothing
+# new to draw: collection paused, or stopped/not connected (still polled to
+# notice the connection coming up)
+PAUSED_UPDATE_INTERVAL_MS = 500
+IDLE_UPDATE_INTERVAL_MS = 2000
+
+# (figure update, new plot state) returned for one page tick
+_PlotUpdate = Tuple[Any, Any]
+
+# Static layout style dicts; status styles are built in assets/osc.js
+_PANEL_STYLE = {
+    "display": "inline-block",
+    "verticalAlign": "top",
+    "padding": "10px",
+    "border": "1px solid #ddd",
+    "borderRadius": "5px",
+    "margin": "5px",
+}
+_NARROW_PANEL_STYLE = {**_PANEL_STYLE, "width": "30%"}
+_WIDE_PANEL_STYLE = {**_PANEL_STYLE, "width": "35%"}
+_PANEL_ROW_STYLE = {"margin": "20px", "display": "flex", "gap": "10px"}
+_BUTTON_ROW_STYLE = {"marginBottom": "10px"}
+_CONTROL_TEXT_STYLE = {"fontSize": "12px"}
+_HIDDEN_STYLE = {"display": "none"}
+# Connection details and buffer statistics are one preformatted string each,
+# so updates only replace text; CSS breaks them into lines
+_DETAILS_STYLE = {"whiteSpace": "pre-line", "fontSize": "14px", "lineHeight": "2"}
+_BUFFER_STATS_STYLE = {"whiteSpace": "pre-line", "lineHeight": "1.5"}
+
+# Button colors; mirrored in assets/osc.js
+_BUTTON_DISABLED_GRAY = "#6c757d"
+_BUTTON_RECORD_RED = "#dc3545"
+_BUTTON_START_GREEN = "#28a745"
+_BUTTON_PAUSE_YELLOW = "#ffc107"
+
+
+@functools.lru_cache(maxsize=None)
+def _button_style(
+    background: str, disabled: bool = False, spaced: bool = True
+) -> dict[str, str]:
+    """Return the shared style dict for a control button.
+
+    Used for the initial layout; later states come from buttonStyle() in
+    assets/osc.js, which must build the same dict.
+
+    Args:
+        background: Button background color.
+        disabled: Whether to render the button dimmed with a not-allowed cursor.
+        spaced: Whether to add right margin separating it from a following button.
+
+    Returns:
+        Style dict; cached per argument combination, so callers must not mutate it.
+    """
+    style = {"marginRight": "10px"} if spaced else {}
+    style.update(
+        {
+            "padding": "8px 16px",
+            "backgroundColor": background,
+            "color": "white",
+            "border": "none",
+            "borderRadius": "4px",
+            "cursor": "not-allowed" if disabled else "pointer",
+            "opacity": "0.6" if disabled else "1.0",
+        }
+    )
+    return style
+
+
+def _points_per_bucket(plot_state: Dict[str, Any]) -> int:
+    """Return how many points each displayed bucket contributes per trace."""
+    return 1 if plot_state["bucket_size"] == 1 else 2
+
 
 class OscilloscopeApp:
     """Real-time sensor data visualization application with comprehensive control interface.
@@ -53,14 +158,22 @@ class OscilloscopeApp:
     Attributes:
         data_source: Abstract data source (BLE or Mock) providing sensor readings.
         buffer: Thread-safe circular buffer storing live sensor data for visualization.
-        update_interval: UI refresh interval in milliseconds (derived from FPS).
+        update_interval: UI refresh interval in milliseconds (derived from FPS)
+            while collecting from a connected source.
         recorder: Integrated recording manager for session-based data capture.
         app: Dash web application instance with complete UI layout.
         _data_thread: Background thread handling asynchronous data collection.
-        _stop_event: Threading event for coordinated shutdown of background operations.
-        _loop: Asyncio event loop dedicated to the data collection thread.
+        _stop_event: Asyncio event on _loop signalling shutdown; other threads set
+            it with loop.call_soon_threadsafe().
+        _loop: Asyncio event loop run by the data collection thread.
+        _collection_task: Task running data collection on _loop; cancelled
+            from other threads to stop collection promptly.
+        _ingest_queue: Lock-free hand-off from the stream loop; drained into
+            buffer in batches so the buffer lock is taken once per batch.
         _collection_paused: User-controlled pause state for selective data capture.
         _collection_running: Overall data collection state tracking.
+        _connection_state: "connecting", "connected" or "disconnected", set by
+            the collection worker as the data source's lifecycle progresses.
 
     Note:
         The class is designed to be instantiated once per application session.
@@ -68,7 +181,12 @@ class OscilloscopeApp:
     """
 
     def __init__(
-        self, data_source: DataSource, buffer_size: int = 1000, update_rate: int = 10
+        self,
+        data_source: DataSource,
+        buffer_size: int = 1000,
+        update_rate: int = 10,
+        record_compression: Optional[str] = None,
+        record_binary_spool: bool = False,
     ):
         """Initialize oscilloscope application with data source and performance parameters.
 
@@ -80,6 +198,12 @@ class OscilloscopeApp:
                 Larger values increase memory usage but provide longer time windows.
             update_rate: UI refresh rate in frames per second. Default 15fps balances
                 responsiveness with CPU usage. Higher values increase system load.
+            record_compression: Compression for recorded files, passed to
+                RecorderManager. "zstd" writes "<name>.csv.zst" files; None
+                (default) writes plain CSV.
+            record_binary_spool: Spool recordings in binary form and convert
+                them to CSV in the background when recording stops, passed to
+                RecorderManager.
 
         Note:
             Buffer size affects both memory usage and maximum displayable time window.
@@ -92,19 +216,44 @@ class OscilloscopeApp:
 
         # Background thread for data collection
         self._data_thread: Optional[threading.Thread] = None
-        self._stop_event = threading.Event()
+        self._stop_event = asyncio.Event()
         self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._collection_task: Optional["asyncio.Task[None]"] = None
+        self._ingest_queue: deque[ImuRow] = deque()
+
+        # Data source identity never changes, so resolve its labels once
+        if isinstance(data_source, BleDataSource):
+            self._device_info = "🔵 BLE Device: XIAO Sense IMU"
+        elif isinstance(data_source, MockDataSource):
+            self._device_info = "🔵 Mock Device: Test Data"
+        else:
+            self._device_info = f"🔵 Device: {type(data_source).__name__}"
 
         # Data collection control state
         self._collection_paused = False
         self._collection_running = False
+        # Written only by the collection worker; a plain attribute read is
+        # enough for the UI callback
+        self._connection_state = "disconnected"
+
+        # Last computed plot update; tabs in the same plot state share it
+        self._plot_update_lock = threading.Lock()
+        self._plot_update_cache: Optional[Tuple[Tuple[Any, ...], _PlotUpdate]] = None
+
+        # "No data" figures by visible plots; reused while waiting for data
+        self._empty_figures: dict[Tuple[str, ...], Any] = {}
 
         # Recording manager (new)
         from ..data_recorder import RecorderManager
         from pathlib import Path
 
         recordings_dir = Path.cwd() / "recordings"
-        self.recorder = RecorderManager(self.buffer, recordings_dir)
+        self.recorder = RecorderManager(
+            self.buffer,
+            recordings_dir,
+            compression=record_compression,
+            binary_spool=record_binary_spool,
+        )
 
         # Create Dash app
         self.app = dash.Dash(__name__)
@@ -146,32 +295,24 @@ class OscilloscopeApp:
                                 html.Div(
                                     id="connection-status", children="Initializing..."
                                 ),
-                                html.Div(id="connection-details", children=""),
+                                html.Div(
+                                    id="connection-details",
+                                    children="",
+                                    style=_DETAILS_STYLE,
+                                ),
                             ],
-                            style={
-                                "width": "30%",
-                                "display": "inline-block",
-                                "verticalAlign": "top",
-                                "padding": "10px",
-                                "border": "1px solid #ddd",
-                                "borderRadius": "5px",
-                                "margin": "5px",
-                            },
+                            style=_NARROW_PANEL_STYLE,
                         ),
                         html.Div(
                             [
                                 html.H3("Buffer Statistics"),
-                                html.Div(id="buffer-stats", children="No data"),
+                                html.Div(
+                                    id="buffer-stats",
+                                    children="No data",
+                                    style=_BUFFER_STATS_STYLE,
+                                ),
                             ],
-                            style={
-                                "width": "35%",
-                                "display": "inline-block",
-                                "verticalAlign": "top",
-                                "padding": "10px",
-                                "border": "1px solid #ddd",
-                                "borderRadius": "5px",
-                                "margin": "5px",
-                            },
+                            style=_WIDE_PANEL_STYLE,
                         ),
                         # Recording Controls Panel
                         html.Div(
@@ -182,50 +323,26 @@ class OscilloscopeApp:
                                         html.Button(
                                             "🔴 Record",
                                             id="start-recording-btn",
-                                            style={
-                                                "marginRight": "10px",
-                                                "padding": "8px 16px",
-                                                "backgroundColor": "#dc3545",
-                                                "color": "white",
-                                                "border": "none",
-                                                "borderRadius": "4px",
-                                                "cursor": "pointer",
-                                            },
+                                            style=_button_style(_BUTTON_RECORD_RED),
                                         ),
                                         html.Button(
                                             "⏹️ Stop",
                                             id="stop-recording-btn",
                                             disabled=True,
-                                            style={
-                                                "marginRight": "10px",
-                                                "padding": "8px 16px",
-                                                "backgroundColor": "#6c757d",
-                                                "color": "white",
-                                                "border": "none",
-                                                "borderRadius": "4px",
-                                                "cursor": "pointer",
-                                            },
+                                            style=_button_style(_BUTTON_DISABLED_GRAY),
                                         ),
                                     ],
-                                    style={"marginBottom": "10px"},
+                                    style=_BUTTON_ROW_STYLE,
                                 ),
                                 html.Div(
                                     id="recording-status", children="⚪ Ready to record"
                                 ),
                                 html.Div(id="recording-info", children=""),
                             ],
-                            style={
-                                "width": "30%",
-                                "display": "inline-block",
-                                "verticalAlign": "top",
-                                "padding": "10px",
-                                "border": "1px solid #ddd",
-                                "borderRadius": "5px",
-                                "margin": "5px",
-                            },
+                            style=_NARROW_PANEL_STYLE,
                         ),
                     ],
-                    style={"margin": "20px", "display": "flex", "gap": "10px"},
+                    style=_PANEL_ROW_STYLE,
                 ),
                 # Second control panels row - Interactive Controls
                 html.Div(
@@ -239,46 +356,25 @@ class OscilloscopeApp:
                                         html.Button(
                                             "▶️ Start Collection",
                                             id="start-collection-btn",
-                                            style={
-                                                "marginRight": "10px",
-                                                "padding": "8px 16px",
-                                                "backgroundColor": "#28a745",
-                                                "color": "white",
-                                                "border": "none",
-                                                "borderRadius": "4px",
-                                                "cursor": "pointer",
-                                            },
+                                            style=_button_style(_BUTTON_START_GREEN),
                                         ),
                                         html.Button(
                                             "⏸️ Pause Collection",
                                             id="pause-collection-btn",
                                             disabled=True,
-                                            style={
-                                                "padding": "8px 16px",
-                                                "backgroundColor": "#6c757d",
-                                                "color": "white",
-                                                "border": "none",
-                                                "borderRadius": "4px",
-                                                "cursor": "pointer",
-                                            },
+                                            style=_button_style(
+                                                _BUTTON_DISABLED_GRAY, spaced=False
+                                            ),
                                         ),
                                     ],
-                                    style={"marginBottom": "10px"},
+                                    style=_BUTTON_ROW_STYLE,
                                 ),
                                 html.Div(
                                     id="collection-status",
                                     children="⏹️ Collection Stopped",
                                 ),
                             ],
-                            style={
-                                "width": "30%",
-                                "display": "inline-block",
-                                "verticalAlign": "top",
-                                "padding": "10px",
-                                "border": "1px solid #ddd",
-                                "borderRadius": "5px",
-                                "margin": "5px",
-                            },
+                            style=_NARROW_PANEL_STYLE,
                         ),
                         # View Controls
                         html.Div(
@@ -289,7 +385,7 @@ class OscilloscopeApp:
                                         html.Label(
                                             "Time Window:",
                                             style={
-                                                "fontSize": "12px",
+                                                **_CONTROL_TEXT_STYLE,
                                                 "marginBottom": "5px",
                                             },
                                         ),
@@ -303,8 +399,8 @@ class OscilloscopeApp:
                                             ],
                                             value=20,  # Default to 20 seconds (500 samples / 25Hz)
                                             style={
-                                                "marginBottom": "10px",
-                                                "fontSize": "12px",
+                                                **_BUTTON_ROW_STYLE,
+                                                **_CONTROL_TEXT_STYLE,
                                             },
                                         ),
                                         html.Div(
@@ -318,22 +414,14 @@ class OscilloscopeApp:
                                                         }
                                                     ],
                                                     value=[],  # Start with auto-scale off
-                                                    style={"fontSize": "12px"},
+                                                    style=_CONTROL_TEXT_STYLE,
                                                 ),
                                             ],
                                         ),
                                     ],
                                 ),
                             ],
-                            style={
-                                "width": "35%",
-                                "display": "inline-block",
-                                "verticalAlign": "top",
-                                "padding": "10px",
-                                "border": "1px solid #ddd",
-                                "borderRadius": "5px",
-                                "margin": "5px",
-                            },
+                            style=_WIDE_PANEL_STYLE,
                         ),
                         # Plot Visibility Controls
                         html.Div(
@@ -353,21 +441,13 @@ class OscilloscopeApp:
                                         "temp",
                                         "audio",
                                     ],  # All visible by default
-                                    style={"fontSize": "12px"},
+                                    style=_CONTROL_TEXT_STYLE,
                                 ),
                             ],
-                            style={
-                                "width": "30%",
-                                "display": "inline-block",
-                                "verticalAlign": "top",
-                                "padding": "10px",
-                                "border": "1px solid #ddd",
-                                "borderRadius": "5px",
-                                "margin": "5px",
-                            },
+                            style=_NARROW_PANEL_STYLE,
                         ),
                     ],
-                    style={"margin": "20px", "display": "flex", "gap": "10px"},
+                    style=_PANEL_ROW_STYLE,
                 ),
                 # Multi-sensor plots
                 html.Div(
@@ -385,9 +465,37 @@ class OscilloscopeApp:
                     interval=self.update_interval,  # in milliseconds
                     n_intervals=0,
                 ),
+                # Interval ticks passed on at the next animation frame; the
+                # server update is driven by this instead of the interval
+                dcc.Store(id="plot-tick"),
+                # What this page's figure currently shows (see _build_plot_figure)
+                dcc.Store(id="plot-state"),
+                # Raw status values rendered by the osc.render* callbacks
+                dcc.Store(id="status-store"),
+                # Values that never change for this app, sent once with the page
+                dcc.Store(
+                    id="source-store",
+                    data={
+                        "device": self._device_info,
+                        "max_size": self.buffer.max_size,
+                        "intervals": {
+                            "live": self.update_interval,
+                            "paused": PAUSED_UPDATE_INTERVAL_MS,
+                            "idle": IDLE_UPDATE_INTERVAL_MS,
+                        },
+                    },
+                ),
+                dcc.Store(id="recording-store"),
+                dcc.Store(id="collection-store"),
+                # Refreshes recording-store; enabled only while recording
+                dcc.Interval(
+                    id="recording-interval",
+                    interval=RECORDING_STATUS_INTERVAL_MS,
+                    disabled=True,
+                ),
                 # Hidden divs to store states
-                html.Div(id="recording-state-store", style={"display": "none"}),
-                html.Div(id="collection-state-store", style={"display": "none"}),
+                html.Div(id="recording-state-store", style=_HIDDEN_STYLE),
+                html.Div(id="collection-state-store", style=_HIDDEN_STYLE),
             ]
         )
 
@@ -399,10 +507,17 @@ class OscilloscopeApp:
         across multiple UI components while maintaining responsive performance.
 
         Callback categories:
-        1. **Main update callback**: Handles real-time plot updates, status displays,
-           and button state management (runs at configured FPS)
+        1. **Main update callback**: Handles real-time plot updates and publishes
+           connection and buffer status (runs at configured FPS while data is
+           flowing, more slowly while collection is paused or idle)
         2. **Recording callbacks**: Handle recording start/stop user interactions
-        3. **Collection callbacks**: Handle data collection start/pause user interactions
+           and publish recording status on those transitions (and once a second
+           while recording)
+        3. **Collection callbacks**: Handle data collection start/pause user
+           interactions and publish collection status on those transitions
+
+        Clientside callbacks render each published status into texts, colors
+        and button states in the browser.
 
         The implementation uses Dash's dependency injection system to efficiently
         update only the UI components that need refreshing, minimizing browser
@@ -415,346 +530,213 @@ class OscilloscopeApp:
         """
 
         @self.app.callback(  # type: ignore
+            [Output("multi-plot", "figure"), Output("plot-state", "data")],
+            [Input("time-window-dropdown", "value")],
             [
-                Output("multi-plot", "figure"),
-                Output("connection-status", "children"),
-                Output("connection-details", "children"),
-                Output("buffer-stats", "children"),
-                Output("recording-status", "children"),
-                Output("recording-info", "children"),
-                Output("start-recording-btn", "disabled"),
-                Output("stop-recording-btn", "disabled"),
-                Output("start-recording-btn", "style"),
-                Output("stop-recording-btn", "style"),
-                # New interactive control outputs
-                Output("collection-status", "children"),
-                Output("start-collection-btn", "disabled"),
-                Output("pause-collection-btn", "disabled"),
-                Output("start-collection-btn", "style"),
-                Output("pause-collection-btn", "style"),
+                State("plot-visibility-checklist", "value"),
+                State("auto-scale-checklist", "value"),
             ],
+        )
+        def update_plot_structure(
+            time_window: int,
+            visible_plots: List[str],
+            auto_scale_list: List[str],
+        ) -> Tuple[Any, Dict[str, Any]]:
+            # Full rebuild only when the time window (data selection) changes
+            return self._build_plot_figure(
+                *self._plot_settings(time_window, visible_plots, auto_scale_list)
+            )
+
+        # Visibility and auto-scale only change the view: apply them in the
+        # browser (assets/osc.js) without a server round-trip
+        self.app.clientside_callback(  # type: ignore
+            ClientsideFunction(namespace="osc", function_name="applyView"),
+            Output("multi-plot", "figure", allow_duplicate=True),
             [
-                Input("interval-component", "n_intervals"),
-                Input("time-window-dropdown", "value"),
                 Input("plot-visibility-checklist", "value"),
                 Input("auto-scale-checklist", "value"),
             ],
+            State("multi-plot", "figure"),
+            prevent_initial_call=True,
+        )
+
+        # Pace server updates by the browser's frame loop: hidden tabs get no
+        # animation frames, so they stop polling until they are shown again
+        self.app.clientside_callback(  # type: ignore
+            ClientsideFunction(namespace="osc", function_name="frameTick"),
+            Output("plot-tick", "data"),
+            Input("interval-component", "n_intervals"),
+            prevent_initial_call=True,
+        )
+
+        @self.app.callback(  # type: ignore
+            [
+                Output("multi-plot", "figure", allow_duplicate=True),
+                Output("plot-state", "data", allow_duplicate=True),
+                Output("status-store", "data"),
+            ],
+            [Input("plot-tick", "data")],
+            [
+                State("time-window-dropdown", "value"),
+                State("plot-visibility-checklist", "value"),
+                State("auto-scale-checklist", "value"),
+                State("plot-state", "data"),
+                State("status-store", "data"),
+            ],
+            prevent_initial_call=True,
         )
         def update_plots(
             n_intervals: int,
             time_window: int,
             visible_plots: List[str],
             auto_scale_list: List[str],
-        ) -> Tuple[Any, ...]:
-            # Provide default values for optional inputs
-            if time_window is None:
-                time_window = 20
-            if visible_plots is None:
-                visible_plots = ["accel", "gyro", "temp", "audio"]
-            if auto_scale_list is None:
-                auto_scale_list = []
-
-            # Get recent data based on time window
-            if time_window and time_window > 0:
-                sample_rate = 25  # Hz, approximate
-                max_samples = int(time_window * sample_rate)
-                data = self.buffer.get_recent(max_samples)
-            else:
-                data = self.buffer.get_recent(500)  # Default
-
-            stats = self.buffer.stats
-            auto_scale = "auto" in auto_scale_list if auto_scale_list else False
-
-            # Enhanced connection status with startup detection
-            buffer_has_data = self.buffer.size > 0
-            data_source_type = type(self.data_source).__name__
-
-            # Check if BLE is in startup phase
-            is_ble_startup = (
-                data_source_type == "BleDataSource"
-                and not buffer_has_data
-                and hasattr(self, "_data_thread")
-                and self._data_thread is not None
-                and self._data_thread.is_alive()
-            )
-
-            is_connected = buffer_has_data
-
-            # Connection status logic
-            if is_connected:
-                if stats.sample_rate > 20:
-                    connection_status = "🟢 Connected (Excellent)"
-                    status_color = "green"
-                elif stats.sample_rate > 15:
-                    connection_status = "🟡 Connected (Good)"
-                    status_color = "orange"
-                else:
-                    connection_status = "🔴 Connected (Poor)"
-                    status_color = "red"
-            elif is_ble_startup:
-                connection_status = "🟡 Connecting to BLE device..."
-                status_color = "orange"
-            else:
-                connection_status = "🔴 Disconnected"
-                status_color = "red"
-
-            # Debug logging - reduced frequency after fixing buffer issue
-            if n_intervals % 100 == 0:  # Log every ~7 seconds at 15fps
-                logger.debug(
-                    f"🔍 UI Debug: Buffer size={self.buffer.size}, Sample rate={stats.sample_rate:.1f}Hz, Status: {connection_status}"
-                )
-
-            # Create multi-sensor plot layout with new parameters
-            # 軽量化: 表示点数の上限キャップ（既定400）を適用
-            multi_fig = create_multi_plot_layout(
-                data,
-                time_window_seconds=time_window,
-                visible_plots=visible_plots,
-                auto_scale=auto_scale,
-                max_points_cap=400,
-            )
-
-            # Debug: Log connection status periodically
-            if n_intervals % 60 == 0:  # Every ~4 seconds
-                logger.debug(
-                    f"🔍 UI Debug: is_connected={is_connected}, buffer_size={self.buffer.size}, "
-                    f"stats.fill_level={stats.fill_level}, stats.sample_rate={stats.sample_rate:.1f}"
-                )
-
-            status_style = {
-                "color": status_color,
-                "fontWeight": "bold",
-                "fontSize": "16px",
-            }
-
-            # Detailed connection information
-            if data_source_type == "BleDataSource":
-                if is_ble_startup:
-                    device_info = "🔵 BLE Device: XIAO Sense IMU (connecting...)"
-                else:
-                    device_info = "🔵 BLE Device: XIAO Sense IMU"
-            elif data_source_type == "MockDataSource":
-                device_info = "🔵 Mock Device: Test Data"
-            else:
-                device_info = f"🔵 Device: {data_source_type}"
-
-            connection_details = html.Div(
-                [
-                    html.P(device_info, style={"margin": "5px 0", "fontSize": "14px"}),
-                    html.P(
-                        f"⏱️ Update Rate: {stats.sample_rate:.1f} Hz",
-                        style={"margin": "5px 0", "fontSize": "14px"},
-                    ),
-                    html.P(
-                        f"📈 Buffer Fill: {stats.fill_level} samples",
-                        style={"margin": "5px 0", "fontSize": "14px"},
-                    ),
-                ]
+            plot_state: Optional[Dict[str, Any]],
+            last_status: Optional[Dict[str, Any]],
+        ) -> Tuple[Any, Any, Dict[str, Any]]:
+            time_window, visible_plots, auto_scale = self._plot_settings(
+                time_window, visible_plots, auto_scale_list
             )
 
-            # Buffer statistics
-            display_time = len(data) / 25.0 if data else 0
-            buffer_info = html.Div(
-                [
-                    html.P(
-                        f"Buffer Fill: {stats.fill_level}/{self.buffer.max_size} "
-                        f"({stats.fill_level / self.buffer.max_size * 100:.1f}%)",
-                        style={"margin": "5px 0"},
-                    ),
-                    html.P(
-                        f"Displaying: {len(data)} data points "
-                        f"({display_time:.1f}s @ 25Hz)",
-                        style={"margin": "5px 0"},
-                    ),
-                    html.P(
-                        f"Time Window: {time_window}s",
-                        style={"margin": "5px 0"},
-                    ),
-                ]
+            # Ship only samples this page has not seen yet
+            multi_fig, new_plot_state = self._next_plot_update(
+                plot_state, time_window, visible_plots, auto_scale
             )
+            shown = plot_state if new_plot_state is dash.no_update else new_plot_state
 
-            # Get recording status
-            recording_status_obj = self.recorder.get_status()
-
-            # Recording status display
-            if recording_status_obj.is_recording:
-                recording_status_text = "🔴 Recording"
-                recording_status_color = "red"
-                start_rec_btn_disabled = True
-                stop_rec_btn_disabled = False
-                start_rec_btn_bg = "#6c757d"  # Gray when disabled
-                stop_rec_btn_bg = "#dc3545"  # Red when active
-            else:
-                recording_status_text = "⚪ Ready to record"
-                recording_status_color = "gray"
-                start_rec_btn_disabled = False
-                stop_rec_btn_disabled = True
-                start_rec_btn_bg = "#dc3545"  # Red when active
-                stop_rec_btn_bg = "#6c757d"  # Gray when disabled
-
-            recording_status_display = html.Span(
-                recording_status_text,
-                style={
-                    "color": recording_status_color,
-                    "fontWeight": "bold",
-                    "fontSize": "16px",
-                },
-            )
+            stats = self.buffer.stats
 
-            # Recording information display
-            if recording_status_obj.is_recording:
-                duration_str = f"{recording_status_obj.duration_seconds:.1f}s"
-                samples_str = f"{recording_status_obj.samples_recorded:,}"
-                file_size_mb = recording_status_obj.file_size_bytes / 1024 / 1024
+            connection = self._connection_state
 
-                recording_info_display = html.Div(
-                    [
-                        html.P(
-                            f"⏱️ Duration: {duration_str}",
-                            style={"margin": "2px 0", "fontSize": "12px"},
-                        ),
-                        html.P(
-                            f"📊 Samples: {samples_str}",
-                            style={"margin": "2px 0", "fontSize": "12px"},
-                        ),
-                        html.P(
-                            f"💾 Size: {file_size_mb:.1f} MB",
-                            style={"margin": "2px 0", "fontSize": "12px"},
-                        ),
-                    ]
-                )
-            else:
-                recording_info_display = html.Div(
-                    [
-                        html.P(
-                            "Click Record to start capturing data",
-                            style={
-                                "margin": "2px 0",
-                                "fontSize": "12px",
-                                "color": "#666",
-                            },
-                        ),
-                    ]
+            if logger.isEnabledFor(logging.DEBUG) and n_intervals % 100 == 0:
+                # Log every ~7 seconds at 15fps
+                logger.debug(
+                    "🔍 UI Debug: Buffer size=%d, Sample rate=%.1fHz, connection=%s",
+                    stats.fill_level,
+                    stats.sample_rate,
+                    connection,
                 )
 
-            # Data collection status and button states
-            if self._collection_running and not self._collection_paused:
-                collection_status_text = "▶️ Collection Running"
-                collection_status_color = "green"
-                start_coll_btn_disabled = True
-                pause_coll_btn_disabled = False
-                start_coll_btn_bg = "#6c757d"
-                pause_coll_btn_bg = "#ffc107"  # Warning color for pause
-            elif self._collection_running and self._collection_paused:
-                collection_status_text = "⏸️ Collection Paused"
-                collection_status_color = "orange"
-                start_coll_btn_disabled = False
-                pause_coll_btn_disabled = True
-                start_coll_btn_bg = "#28a745"
-                pause_coll_btn_bg = "#6c757d"
-            else:
-                collection_status_text = "⏹️ Collection Stopped"
-                collection_status_color = "gray"
-                start_coll_btn_disabled = False
-                pause_coll_btn_disabled = True
-                start_coll_btn_bg = "#28a745"
-                pause_coll_btn_bg = "#6c757d"
-
-            collection_status_display = html.Span(
-                collection_status_text,
-                style={
-                    "color": collection_status_color,
-                    "fontWeight": "bold",
-                    "fontSize": "16px",
-                },
-            )
-
-            # Button styles
-            start_rec_btn_style = {
-                "marginRight": "10px",
-                "padding": "8px 16px",
-                "backgroundColor": start_rec_btn_bg,
-                "color": "white",
-                "border": "none",
-                "borderRadius": "4px",
-                "cursor": "pointer" if not start_rec_btn_disabled else "not-allowed",
-                "opacity": "0.6" if start_rec_btn_disabled else "1.0",
-            }
-
-            stop_rec_btn_style = {
-                "marginRight": "10px",
-                "padding": "8px 16px",
-                "backgroundColor": stop_rec_btn_bg,
-                "color": "white",
-                "border": "none",
-                "borderRadius": "4px",
-                "cursor": "pointer" if not stop_rec_btn_disabled else "not-allowed",
-                "opacity": "0.6" if stop_rec_btn_disabled else "1.0",
-            }
-
-            start_coll_btn_style = {
-                "marginRight": "10px",
-                "padding": "8px 16px",
-                "backgroundColor": start_coll_btn_bg,
-                "color": "white",
-                "border": "none",
-                "borderRadius": "4px",
-                "cursor": "pointer" if not start_coll_btn_disabled else "not-allowed",
-                "opacity": "0.6" if start_coll_btn_disabled else "1.0",
+            # Raw state only; assets/osc.js (osc.renderConnection) turns it
+            # into the status texts in the browser
+            status = {
+                "connection": connection,
+                "sample_rate": stats.sample_rate,
+                "fill_level": stats.fill_level,
+                "buckets": shown["buckets"] if shown else 0,
+                "bucket_size": shown["bucket_size"] if shown else 1,
+                "time_window": time_window,
             }
+            if multi_fig is dash.no_update and status == last_status:
+                # Nothing arrived since the previous tick (collection paused or
+                # BLE dropout): skip the response entirely
+                raise PreventUpdate
+            return multi_fig, new_plot_state, status
 
-            pause_coll_btn_style = {
-                "padding": "8px 16px",
-                "backgroundColor": pause_coll_btn_bg,
-                "color": "white",
-                "border": "none",
-                "borderRadius": "4px",
-                "cursor": "pointer" if not pause_coll_btn_disabled else "not-allowed",
-                "opacity": "0.6" if pause_coll_btn_disabled else "1.0",
+        @self.app.callback(  # type: ignore
+            [
+                Output("recording-store", "data"),
+                Output("recording-interval", "disabled"),
+            ],
+            [
+                Input("recording-state-store", "children"),
+                Input("recording-interval", "n_intervals"),
+            ],
+        )
+        def update_recording_status(
+            recording_state: Optional[str], n_intervals: int
+        ) -> Tuple[Dict[str, Any], bool]:
+            # Runs on start/stop; the recording interval only ticks while a
+            # recording is in progress, to keep its duration and size current
+            recording = self.recorder.get_status()
+            status = {
+                "is_recording": recording.is_recording,
+                "duration": recording.duration_seconds,
+                "samples": recording.samples_recorded,
+                "file_size": recording.file_size_bytes,
             }
+            return status, not recording.is_recording
 
-            return (
-                multi_fig,
-                html.Span(connection_status, style=status_style),
-                connection_details,
-                buffer_info,
-                recording_status_display,
-                recording_info_display,
-                start_rec_btn_disabled,
-                stop_rec_btn_disabled,
-                start_rec_btn_style,
-                stop_rec_btn_style,
-                collection_status_display,
-                start_coll_btn_disabled,
-                pause_coll_btn_disabled,
-                start_coll_btn_style,
-                pause_coll_btn_style,
-            )
-
-        # Recording control callbacks
         @self.app.callback(  # type: ignore
-            Output("recording-state-store", "children"),
-            [Input("start-recording-btn", "n_clicks")],
+            Output("collection-store", "data"),
+            [Input("collection-state-store", "children")],
+        )
+        def update_collection_status(collection_state: Optional[str]) -> str:
+            # Runs on page load and on start/pause clicks only
+            if not self._collection_running:
+                return "stopped"
+            if self._collection_paused:
+                return "paused"
+            return "running"
+
+        # Status texts, colors and button states are derived in the browser
+        self.app.clientside_callback(  # type: ignore
+            ClientsideFunction(namespace="osc", function_name="renderConnection"),
+            [
+                Output("connection-status", "children"),
+                Output("connection-details", "children"),
+                Output("buffer-stats", "children"),
+            ],
+            Input("status-store", "data"),
+            State("source-store", "data"),
+            prevent_initial_call=True,
+        )
+        self.app.clientside_callback(  # type: ignore
+            ClientsideFunction(namespace="osc", function_name="renderRecording"),
+            [
+                Output("recording-status", "children"),
+                Output("recording-info", "children"),
+                Output("recording-info", "style"),
+                Output("start-recording-btn", "disabled"),
+                Output("stop-recording-btn", "disabled"),
+                Output("start-recording-btn", "style"),
+                Output("stop-recording-btn", "style"),
+            ],
+            Input("recording-store", "data"),
+            prevent_initial_call=True,
+        )
+        self.app.clientside_callback(  # type: ignore
+            ClientsideFunction(namespace="osc", function_name="renderCollection"),
+            [
+                Output("collection-status", "children"),
+                Output("start-collection-btn", "disabled"),
+                Output("pause-collection-btn", "disabled"),
+                Output("start-collection-btn", "style"),
+                Output("pause-collection-btn", "style"),
+            ],
+            Input("collection-store", "data"),
+            prevent_initial_call=True,
+        )
+        # Full plot rate only while data is flowing; slower polling otherwise
+        self.app.clientside_callback(  # type: ignore
+            ClientsideFunction(namespace="osc", function_name="tickInterval"),
+            Output("interval-component", "interval"),
+            [
+                Input("status-store", "data"),
+                Input("collection-store", "data"),
+            ],
+            State("source-store", "data"),
             prevent_initial_call=True,
         )
-        def start_recording(n_clicks: int):  # type: ignore
-            if n_clicks and not self.recorder.is_recording:
-                try:
-                    self.recorder.start_recording()
-                    logger.info("🎬 Recording started successfully")
-                    return "recording"
-                except Exception as e:
-                    logger.error(f"❌ Failed to start recording: {e}")
-                    return "error"
-            return "idle"
 
+        # Recording control: both buttons share one callback and dispatch on
+        # the button that fired
         @self.app.callback(  # type: ignore
-            Output("recording-state-store", "children", allow_duplicate=True),
-            [Input("stop-recording-btn", "n_clicks")],
+            Output("recording-state-store", "children"),
+            Input("start-recording-btn", "n_clicks"),
+            Input("stop-recording-btn", "n_clicks"),
             prevent_initial_call=True,
         )
-        def stop_recording(n_clicks: int):  # type: ignore
-            if n_clicks and self.recorder.is_recording:
+        def control_recording(start_clicks: int, stop_clicks: int):  # type: ignore
+            if dash.ctx.triggered_id == "start-recording-btn":
+                if start_clicks and not self.recorder.is_recording:
+                    try:
+                        self.recorder.start_recording()
+                        logger.info("🎬 Recording started successfully")
+                        return "recording"
+                    except Exception as e:
+                        logger.error(f"❌ Failed to start recording: {e}")
+                        return "error"
+            elif stop_clicks and self.recorder.is_recording:
                 try:
                     session_info = self.recorder.stop_recording()
                     logger.info(
@@ -768,38 +750,34 @@ class OscilloscopeApp:
                     return "error"
             return "idle"
 
-        # Data collection control callbacks
+        # Data collection control, dispatched the same way
         @self.app.callback(  # type: ignore
             Output("collection-state-store", "children"),
-            [Input("start-collection-btn", "n_clicks")],
+            Input("start-collection-btn", "n_clicks"),
+            Input("pause-collection-btn", "n_clicks"),
             prevent_initial_call=True,
         )
-        def start_collection(n_clicks: int):  # type: ignore
-            if n_clicks:
-                try:
-                    if not self._collection_running:
-                        # Start new collection
-                        self.start_data_collection()
-                        self._collection_running = True
-                        self._collection_paused = False
-                        logger.info("▶️ Data collection started")
-                    elif self._collection_paused:
-                        # Resume paused collection
-                        self._collection_paused = False
-                        logger.info("▶️ Data collection resumed")
-                    return "running"
-                except Exception as e:
-                    logger.error(f"❌ Failed to start/resume collection: {e}")
-                    return "error"
-            return "idle"
-
-        @self.app.callback(  # type: ignore
-            Output("collection-state-store", "children", allow_duplicate=True),
-            [Input("pause-collection-btn", "n_clicks")],
-            prevent_initial_call=True,
-        )
-        def pause_collection(n_clicks: int):  # type: ignore
-            if n_clicks and self._collection_running and not self._collection_paused:
+        def control_collection(start_clicks: int, pause_clicks: int):  # type: ignore
+            if dash.ctx.triggered_id == "start-collection-btn":
+                if start_clicks:
+                    try:
+                        if not self._collection_running:
+                            # Start new collection
+                            self.start_data_collection()
+                            logger.info("▶️ Data collection started")
+                        elif self._collection_paused:
+                            # Resume paused collection
+                            self._collection_paused = False
+                            logger.info("▶️ Data collection resumed")
+                        return "running"
+                    except Exception as e:
+                        logger.error(f"❌ Failed to start/resume collection: {e}")
+                        return "error"
+            elif (
+                pause_clicks
+                and self._collection_running
+                and not self._collection_paused
+            ):
                 try:
                     self._collection_paused = True
                     logger.info("⏸️ Data collection paused")
@@ -809,7 +787,184 @@ class OscilloscopeApp:
                     return "error"
             return "idle"
 
-    def _data_collection_worker(self) -> None:
+    @staticmethod
+    def _plot_settings(
+        time_window: Optional[int],
+        visible_plots: Optional[List[str]],
+        auto_scale_list: Optional[List[str]],
+    ) -> Tuple[int, List[str], bool]:
+        """Apply defaults to the display control values."""
+        # Provide default values for optional inputs
+        if time_window is None:
+            time_window = 20
+        if visible_plots is None:
+            visible_plots = ["accel", "gyro", "temp", "audio"]
+        auto_scale = "auto" in auto_scale_list if auto_scale_list else False
+        return time_window, visible_plots, auto_scale
+
+    @staticmethod
+    def _plot_window(time_window: int) -> Tuple[int, int]:
+        """Return (window length in samples, min/max bucket size) for a time window.
+
+        Long windows are downsampled rather than truncated, so the whole window
+        stays visible while at most MAX_PLOT_POINTS points are drawn per trace.
+        """
+        if time_window > 0:
+            sample_rate = 25  # Hz, approximate
+            window_samples = int(time_window * sample_rate)
+        else:
+            window_samples = 500  # Default
+        # 軽量化: 表示点数の上限キャップ（既定400）をmin/max間引きで適用
+        if window_samples <= MAX_PLOT_POINTS:
+            return window_samples, 1
+        return window_samples, math.ceil(window_samples / (MAX_PLOT_POINTS // 2))
+
+    def _build_plot_figure(
+        self, time_window: int, visible_plots: List[str], auto_scale: bool
+    ) -> Tuple[Any, Dict[str, Any]]:
+        """Build the complete figure and the plot state describing it.
+
+        The plot state is kept by the page in its "plot-state" store and sent
+        back on every tick, so each browser tab is continued independently:
+            window: Time window the figure was built for.
+            origin: Device millis mapped to x=0, or None for the empty figure.
+            bucket_size: Samples per min/max bucket.
+            buckets: Number of buckets the figure shows.
+            seq: Buffer index one past the last sample shown.
+        """
+        window_samples, bucket_size = self._plot_window(time_window)
+        # Bucket-aligned window so later patches continue the same buckets
+        data, start, end = self.buffer.get_recent_arrays(window_samples, bucket_size)
+        millis = data["millis"]
+        state = {
+            "window": time_window,
+            "origin": int(millis[0]) if len(millis) else None,
+            "bucket_size": bucket_size,
+            "buckets": (end - start) // bucket_size,
+            "seq": end,
+        }
+
+        if not len(millis):
+            # Identical on every build until data arrives, so build it once
+            key = tuple(visible_plots)
+            if key not in self._empty_figures:
+                self._empty_figures[key] = create_multi_plot_layout(
+                    data, time_window_seconds=0, visible_plots=visible_plots
+                )
+            return self._empty_figures[key], state
+
+        figure = create_multi_plot_layout(
+            data,
+            time_window_seconds=0,  # Already limited to the display window
+            visible_plots=visible_plots,
+            auto_scale=auto_scale,
+            time_origin_millis=state["origin"],
+            bucket_size=bucket_size,
+        )
+        return figure, state
+
+    def _next_plot_update(
+        self,
+        state: Optional[Dict[str, Any]],
+        time_window: int,
+        visible_plots: List[str],
+        auto_scale: bool,
+    ) -> _PlotUpdate:
+        """Return (figure update, new plot state) for one tick of one page.
+
+        Pages that send the same plot state while the buffer has not changed
+        get the same result, so several tabs viewing the device share one
+        computed update instead of each building their own.
+        """
+        key = (
+            time_window,
+            tuple(visible_plots),
+            auto_scale,
+            tuple(sorted(state.items())) if state else None,
+            self.buffer.current_write_index,
+        )
+        with self._plot_update_lock:
+            cached = self._plot_update_cache
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
+        result = self._compute_plot_update(
+            state, time_window, visible_plots, auto_scale
+        )
+        with self._plot_update_lock:
+            self._plot_update_cache = (key, result)
+        return result
+
+    def _compute_plot_update(
+        self,
+        state: Optional[Dict[str, Any]],
+        time_window: int,
+        visible_plots: List[str],
+        auto_scale: bool,
+    ) -> _PlotUpdate:
+        """Compute the figure update that continues a page's plot state.
+
+        Normally this is a Patch that appends the buckets completed since the
+        previous tick, so both the buffer read and the payload are O(new
+        samples) instead of the whole window. The figure is rebuilt when the
+        displayed figure is empty or the buffer no longer holds the samples
+        needed to continue it.
+        """
+        if not state:
+            return self._build_plot_figure(time_window, visible_plots, auto_scale)
+
+        window_samples, bucket_size = self._plot_window(time_window)
+        seq = state["seq"]
+        new_data, extents, start, end = self.buffer.get_arrays_since(
+            seq, window_samples, bucket_size
+        )
+
+        if state["origin"] is None:
+            if end == start:
+                return dash.no_update, dash.no_update
+            return self._build_plot_figure(time_window, visible_plots, auto_scale)
+        if state["window"] != time_window:
+            # Window changed; the structure callback delivers the new figure
+            return dash.no_update, dash.no_update
+        if end < seq:
+            # The buffer was cleared
+            return self._build_plot_figure(time_window, visible_plots, auto_scale)
+
+        # Buckets the display should hold, and how many of them are new
+        target_buckets = (end - start) // bucket_size
+        new_buckets = (end - max(seq, start)) // bucket_size
+        if new_buckets >= target_buckets:
+            # Fell behind the window; replacing it is cheaper as a full figure
+            return self._build_plot_figure(time_window, visible_plots, auto_scale)
+        if not new_buckets:
+            return dash.no_update, dash.no_update
+
+        trim_buckets = max(0, state["buckets"] + new_buckets - target_buckets)
+        patch = create_plot_patch(
+            new_data,
+            extents,
+            time_origin_millis=state["origin"],
+            trim_count=trim_buckets * _points_per_bucket(state),
+            bucket_size=bucket_size,
+        )
+        new_state = dict(
+            state, buckets=state["buckets"] + new_buckets - trim_buckets, seq=end
+        )
+        return patch, new_state
+
+    def _flush_ingest_queue(self) -> None:
+        """Move every queued row into the buffer with one batched write.
+
+        Only called on the collection loop, which is also the only producer,
+        so the queue can be copied and cleared without losing rows.
+        """
+        queue = self._ingest_queue
+        if queue:
+            batch = list(queue)
+            queue.clear()
+            self.buffer.extend(batch)
+
+    def _data_collection_worker(self, loop: asyncio.AbstractEventLoop) -> None:
         """Background worker managing robust data collection with comprehensive retry logic.
 
         This method runs in a dedicated thread with its own asyncio event loop,
@@ -833,19 +988,40 @@ class OscilloscopeApp:
         connection establishment, data streaming, error recovery, and cleanup.
         It's designed to run continuously until explicitly stopped by the UI.
 
+        Args:
+            loop: Event loop created for this thread by start_data_collection().
+
         Note:
-            This method creates and manages its own asyncio event loop to avoid
-            conflicts with Dash's event loop. All BLE operations are async to
-            prevent blocking the data stream during I/O operations.
+            This method runs its own asyncio event loop because the Dash
+            (Flask/WSGI) server blocks the main thread. Collection runs as a task
+            on that loop so other threads can stop it by setting _stop_event and
+            cancelling the task; the loop itself is only ever closed by this
+            thread.
         """
 
+        async def drain_ingest_queue() -> None:
+            while True:
+                await asyncio.sleep(INGEST_DRAIN_INTERVAL)
+                self._flush_ingest_queue()
+
         async def collect_data_with_retry() -> None:
+            drain_task = asyncio.get_running_loop().create_task(drain_ingest_queue())
+            try:
+                await collect_rows()
+            finally:
+                drain_task.cancel()
+                self._flush_ingest_queue()
+                self._connection_state = "disconnected"
+                logger.info("🏁 Data collection worker finished")
+
+        async def collect_rows() -> None:
             retry_count = 0
             max_retries = 5  # Increased retries
             retry_delay = 3.0  # Reduced initial delay
             backoff_multiplier = 1.5  # Exponential backoff
 
             while not self._stop_event.is_set() and retry_count < max_retries:
+                self._connection_state = "connecting"
                 try:
                     logger.info(
                         f"🔄 Starting data source (attempt {retry_count + 1}/{max_retries})..."
@@ -853,6 +1029,7 @@ class OscilloscopeApp:
                     await self.data_source.start()
 
                     data_count = 0
+                    receiving = False
 
                     logger.info("✅ Data source started, beginning data collection...")
 
@@ -863,22 +1040,31 @@ class OscilloscopeApp:
                             )
                             break
 
-                        # Check if collection is paused
+                        if not receiving:
+                            # First row of this connection, even while paused
+                            self._connection_state = "connected"
+                            receiving = True
+
+                        # Rows arriving while paused are discarded. The stream
+                        # itself paces this loop, so no polling is needed, and
+                        # it must keep being consumed: a BLE source queues
+                        # notifications and would replay them as stale data
                         if self._collection_paused:
-                            # When paused, sleep briefly and check again
-                            await asyncio.sleep(0.1)
                             continue
 
-                        self.buffer.append(row)
+                        self._ingest_queue.append(row)
                         data_count += 1
 
-                        # Log progress periodically
-                        if data_count % 25 == 1:  # Log every 25 samples (~1 second)
+                        # Log progress periodically (~1 second at 25Hz)
+                        if data_count % 25 == 1 and logger.isEnabledFor(logging.DEBUG):
                             buffer_stats = self.buffer.stats
                             logger.debug(
-                                f"📊 Background: Collected {data_count} samples, "
-                                f"buffer: {self.buffer.size}/{self.buffer.max_size}, "
-                                f"rate: {buffer_stats.sample_rate:.1f}Hz"
+                                "📊 Background: Collected %d samples, "
+                                "buffer: %d/%d, rate: %.1fHz",
+                                data_count,
+                                buffer_stats.fill_level,
+                                self.buffer.max_size,
+                                buffer_stats.sample_rate,
                             )
 
                     # If we exit the loop normally, we're done
@@ -892,14 +1078,13 @@ class OscilloscopeApp:
 
                 except Exception as e:
                     retry_count += 1
-                    logger.error(
-                        f"❌ Data collection error (attempt {retry_count}/{max_retries}): {e}"
+                    # The logged traceback also names the error type
+                    logger.exception(
+                        "❌ Data collection error (attempt %d/%d): %s",
+                        retry_count,
+                        max_retries,
+                        e,
                     )
-                    logger.error(f"❌ Error type: {type(e).__name__}")
-                    import traceback
-
-                    logger.error("❌ Full traceback:")
-                    traceback.print_exc()
 
                     if retry_count < max_retries:
                         current_delay = retry_delay * (
@@ -909,9 +1094,14 @@ class OscilloscopeApp:
                             f"⏳ Retrying in {current_delay:.1f} seconds... (retry {retry_count}/{max_retries})"
                         )
                         try:
-                            await asyncio.sleep(current_delay)
-                        except asyncio.CancelledError:
-                            break
+                            # Wake immediately if stop is requested during backoff;
+                            # cancellation simply propagates out of the task
+                            await asyncio.wait_for(
+                                self._stop_event.wait(), timeout=current_delay
+                            )
+                        except asyncio.TimeoutError:
+                            continue
+                        break
                     else:
                         logger.error(
                             f"💥 Max retries ({max_retries}) exceeded. Giving up."
@@ -926,22 +1116,35 @@ class OscilloscopeApp:
 
                 finally:
                     try:
-                        await self.data_source.stop()
+                        # Bounded so a hung source cannot stall shutdown
+                        await asyncio.wait_for(
+                            self.data_source.stop(), timeout=DATA_SOURCE_STOP_TIMEOUT
+                        )
+                    except asyncio.TimeoutError:
+                        logger.warning(
+                            "⚠️ Data source did not stop within %.1fs",
+                            DATA_SOURCE_STOP_TIMEOUT,
+                        )
                     except Exception as e:
                         logger.warning(f"⚠️ Error stopping data source: {e}")
 
-            logger.info("🏁 Data collection worker finished")
-
-        # Create new event loop for this thread
-        self._loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(self._loop)
+        # Run the loop created for this thread by start_data_collection()
+        asyncio.set_event_loop(loop)
 
         try:
-            self._loop.run_until_complete(collect_data_with_retry())
+            task = loop.create_task(collect_data_with_retry())
+            self._collection_task = task
+            loop.run_until_complete(task)
+        except asyncio.CancelledError:
+            logger.info("🛑 Data collection cancelled")
         except Exception as e:
             logger.error(f"💥 Worker fatal error: {e}")
         finally:
-            self._loop.close()
+            self._collection_task = None
+            if self._loop is loop:
+                self._loop = None
+            loop.run_until_complete(loop.shutdown_asyncgens())
+            loop.close()
 
     def start_data_collection(self) -> None:
         """Start background data collection thread with proper lifecycle management.
@@ -959,22 +1162,34 @@ class OscilloscopeApp:
             continues operation.
         """
         if self._data_thread is None or not self._data_thread.is_alive():
-            self._stop_event.clear()
+            # The loop and its stop event exist before the thread starts, so a
+            # stop request can never race ahead of the worker's setup. uvloop
+            # has cheaper per-await scheduling for the many small stream steps
+            loop = (
+                uvloop.new_event_loop()
+                if uvloop is not None
+                else asyncio.new_event_loop()
+            )
+            self._loop = loop
+            self._stop_event = asyncio.Event()
             self._data_thread = threading.Thread(
-                target=self._data_collection_worker, daemon=True
+                target=self._data_collection_worker, args=(loop,), daemon=True
             )
             self._data_thread.start()
+            # Reported to the UI via collection-store, which also selects the
+            # plot refresh rate
+            self._collection_running = True
+            self._collection_paused = False
 
     def stop_data_collection(self) -> None:
         """Stop background data collection with graceful shutdown and cleanup.
 
         This method coordinates the shutdown of all background data collection
-        operations, including thread termination and asyncio event loop cleanup.
-        The implementation provides reasonable timeout values to ensure responsive
-        shutdown while allowing ongoing operations to complete cleanly.
-
-        Cleanup is comprehensive - both the worker thread and its associated
-        asyncio event loop are properly terminated to prevent resource leaks.
+        operations. The stop event is set and the collection task cancelled on
+        the worker's own loop, so shutdown neither polls nor waits for the next
+        sample to arrive, and the data source is still stopped cleanly by the
+        task's cleanup code. The worker thread closes its event loop itself
+        once the task has finished.
 
         Note:
             If the worker thread doesn't respond to shutdown requests within the
@@ -982,7 +1197,16 @@ class OscilloscopeApp:
             terminated when the main process exits.
         """
         logger.info("🛑 Stopping data collection...")
-        self._stop_event.set()
+        self._collection_running = False
+
+        loop, task = self._loop, self._collection_task
+        if loop is not None:
+            try:
+                loop.call_soon_threadsafe(self._stop_event.set)
+                if task is not None:
+                    loop.call_soon_threadsafe(task.cancel)
+            except RuntimeError:
+                pass  # Loop already closed; the worker is exiting
 
         if self._data_thread and self._data_thread.is_alive():
             logger.info("⏳ Waiting for data collection thread to stop...")
@@ -993,14 +1217,6 @@ class OscilloscopeApp:
             else:
                 logger.info("✅ Data collection thread stopped")
 
-        # Close the event loop if it exists
-        if self._loop and not self._loop.is_closed():
-            try:
-                self._loop.close()
-                logger.info("✅ Event loop closed")
-            except Exception as e:
-                logger.warning(f"⚠️ Error closing event loop: {e}")
-
     def run(
         self, host: str = "127.0.0.1", port: int = 8050, debug: bool = False
     ) -> None:
@@ -1031,7 +1247,7 @@ class OscilloscopeApp:
             self.stop_data_collection()
 
 
-def create_app(data_source: DataSource, **kwargs: int) -> OscilloscopeApp:
+def create_app(data_source: DataSource, **kwargs: Any) -> OscilloscopeApp:
     """Factory function to create an oscilloscope app.
 
     Args:
@@ -1046,7 +1262,5 @@ def create_app(data_source: DataSource, **kwargs: int) -> OscilloscopeApp:
 
 if __name__ == "__main__":
     # Run with mock data for testing
-    from ..ble_receiver import MockDataSource
-
     app = create_app(MockDataSource())
     app.run(debug=True)
@@ -0,0 +1,321 @@
+/*
+ * Clientside callbacks for the oscilloscope dashboard.
+ *
+ * View-only controls (plot visibility, auto-scale) are applied in the browser
+ * so toggling them needs no server round-trip or figure rebuild. The figure
+ * structure is produced by plots.create_multi_plot_layout: one trace per
+ * channel tagged with meta.plot, and subplot titles named after their plot.
+ *
+ * Status texts and button states are likewise rendered here from the raw
+ * values the server publishes in status-store, recording-store and
+ * collection-store, and interval ticks are paced by animation frames and
+ * slowed down while collection is paused, stopped or not connected.
+ */
+(function () {
+    // Subplot order in the 2x2 grid: xaxis/yaxis, xaxis2/yaxis2, ...
+    const PLOTS = ["accel", "gyro", "temp", "audio"];
+
+    // Must match plots.FIXED_YAXIS_RANGES
+    const FIXED_YAXIS_RANGES = {
+        accel: [-2, 2],
+        gyro: [-50, 50],
+        audio: [0, 2000],
+    };
+
+    function applyView(visiblePlots, autoScaleList, figure) {
+        if (!figure || !figure.layout) {
+            return window.dash_clientside.no_update;
+        }
+        const visible = visiblePlots || [];
+        const autoScale = (autoScaleList || []).includes("auto");
+        const layout = Object.assign({}, figure.layout);
+
+        const data = (figure.data || []).map(function (trace) {
+            const plot = trace.meta && trace.meta.plot;
+            return Object.assign({}, trace, {visible: visible.includes(plot)});
+        });
+
+        layout.annotations = (layout.annotations || []).map(function (annotation) {
+            if (!PLOTS.includes(annotation.name)) {
+                return annotation;
+            }
+            return Object.assign({}, annotation, {
+                visible: visible.includes(annotation.name),
+            });
+        });
+
+        PLOTS.forEach(function (plot, index) {
+            const suffix = index === 0 ? "" : String(index + 1);
+            const shown = visible.includes(plot);
+            const xaxis = Object.assign({}, layout["xaxis" + suffix], {visible: shown});
+            const yaxis = Object.assign({}, layout["yaxis" + suffix], {visible: shown});
+            // Temperature is always scaled to its data by the server
+            if (plot in FIXED_YAXIS_RANGES) {
+                if (autoScale) {
+                    yaxis.autorange = true;
+                    delete yaxis.range;
+                } else {
+                    yaxis.autorange = false;
+                    yaxis.range = FIXED_YAXIS_RANGES[plot];
+                }
+            }
+            layout["xaxis" + suffix] = xaxis;
+            layout["yaxis" + suffix] = yaxis;
+        });
+
+        return Object.assign({}, figure, {data: data, layout: layout});
+    }
+
+    // Must match the _BUTTON_* colors and _button_style() in app.py
+    const GRAY = "#6c757d";
+    const RED = "#dc3545";
+    const GREEN = "#28a745";
+    const YELLOW = "#ffc107";
+
+    function buttonStyle(background, disabled, spaced) {
+        const style = spaced ? {marginRight: "10px"} : {};
+        return Object.assign(style, {
+            padding: "8px 16px",
+            backgroundColor: background,
+            color: "white",
+            border: "none",
+            borderRadius: "4px",
+            cursor: disabled ? "not-allowed" : "pointer",
+            opacity: disabled ? "0.6" : "1.0",
+        });
+    }
+
+    // Every style the status panels use, built once and shared by all
+    // updates; Dash treats props as immutable, so they are never modified.
+    // Button styles are indexed by the button's disabled flag.
+    const BUTTON_STYLES = {
+        startRecording: {
+            true: buttonStyle(GRAY, true, true),
+            false: buttonStyle(RED, false, true),
+        },
+        stopRecording: {
+            true: buttonStyle(GRAY, true, true),
+            false: buttonStyle(RED, false, true),
+        },
+        startCollection: {
+            true: buttonStyle(GRAY, true, true),
+            false: buttonStyle(GREEN, false, true),
+        },
+        pauseCollection: {
+            true: buttonStyle(GRAY, true, false),
+            false: buttonStyle(YELLOW, false, false),
+        },
+    };
+    const STATUS_TEXT_STYLES = {};
+    ["green", "orange", "red", "gray"].forEach(function (color) {
+        STATUS_TEXT_STYLES[color] = {
+            color: color,
+            fontWeight: "bold",
+            fontSize: "16px",
+        };
+    });
+    // Multi-line panels are single strings; CSS breaks them into lines
+    const RECORDING_INFO_STYLE = {
+        whiteSpace: "pre-line",
+        fontSize: "12px",
+        lineHeight: "1.5",
+    };
+    const RECORDING_HINT_STYLE = Object.assign({}, RECORDING_INFO_STYLE, {
+        color: "#666",
+    });
+
+    function component(type, children, style) {
+        return {
+            namespace: "dash_html_components",
+            type: type,
+            props: {children: children, style: style},
+        };
+    }
+
+    function statusText(text, color) {
+        return component("Span", text, STATUS_TEXT_STYLES[color]);
+    }
+
+    function connectionStatus(status) {
+        if (status.connection === "connected") {
+            if (status.sample_rate > 20) {
+                return statusText("🟢 Connected (Excellent)", "green");
+            }
+            if (status.sample_rate > 15) {
+                return statusText("🟡 Connected (Good)", "orange");
+            }
+            return statusText("🔴 Connected (Poor)", "red");
+        }
+        if (status.connection === "connecting") {
+            return statusText("🟡 Connecting to BLE device...", "orange");
+        }
+        return statusText("🔴 Disconnected", "red");
+    }
+
+    // Nominal device sample period (25 Hz)
+    const SECONDS_PER_SAMPLE = 0.04;
+
+    function bufferStats(status, source) {
+        const points = status.buckets * (status.bucket_size === 1 ? 1 : 2);
+        const seconds = status.buckets * status.bucket_size * SECONDS_PER_SAMPLE;
+        const percent = status.fill_level * source.percentPerSample;
+        return (
+            `Buffer Fill: ${status.fill_level}/${source.max_size} ` +
+            `(${percent.toFixed(1)}%)\n` +
+            `Displaying: ${points} data points (${seconds.toFixed(1)}s @ 25Hz)\n` +
+            `Time Window: ${status.time_window}s`
+        );
+    }
+
+    function recordingInfo(status) {
+        if (!status.is_recording) {
+            return "Click Record to start capturing data";
+        }
+        const megabytes = status.file_size / 1024 / 1024;
+        return (
+            `⏱️ Duration: ${status.duration.toFixed(1)}s\n` +
+            `📊 Samples: ${status.samples.toLocaleString("en-US")}\n` +
+            `💾 Size: ${megabytes.toFixed(1)} MB`
+        );
+    }
+
+    // Outputs rendered on this page's previous update of each panel, as JSON
+    const previousOutputs = {};
+
+    // Replace outputs equal to the panel's previous ones with no_update
+    function changedOnly(panel, outputs) {
+        const keys = outputs.map(function (output) {
+            return JSON.stringify(output);
+        });
+        const previous = previousOutputs[panel] || [];
+        previousOutputs[panel] = keys;
+        return outputs.map(function (output, index) {
+            return keys[index] === previous[index]
+                ? window.dash_clientside.no_update
+                : output;
+        });
+    }
+
+    function noUpdate(count) {
+        return Array(count).fill(window.dash_clientside.no_update);
+    }
+
+    // source-store contents with derived constants, computed once per page
+    let sourceInfo = null;
+
+    function renderConnection(status, source) {
+        if (!status || !source) {
+            return noUpdate(3);
+        }
+        if (sourceInfo === null) {
+            sourceInfo = Object.assign({}, source, {
+                percentPerSample: 100 / source.max_size,
+                connectingLabel: source.device + " (connecting...)",
+            });
+        }
+        const connecting = status.connection === "connecting";
+        const device = connecting ? sourceInfo.connectingLabel : sourceInfo.device;
+        return changedOnly("connection", [
+            connectionStatus(status),
+            `${device}\n⏱️ Update Rate: ${status.sample_rate.toFixed(1)} Hz\n` +
+                `📈 Buffer Fill: ${status.fill_level} samples`,
+            bufferStats(status, sourceInfo),
+        ]);
+    }
+
+    function renderRecording(status) {
+        if (!status) {
+            return noUpdate(7);
+        }
+        const recording = status.is_recording;
+        return changedOnly("recording", [
+            recording
+                ? statusText("🔴 Recording", "red")
+                : statusText("⚪ Ready to record", "gray"),
+            recordingInfo(status),
+            recording ? RECORDING_INFO_STYLE : RECORDING_HINT_STYLE,
+            recording,
+            !recording,
+            BUTTON_STYLES.startRecording[recording],
+            BUTTON_STYLES.stopRecording[!recording],
+        ]);
+    }
+
+    function renderCollection(collection) {
+        if (!collection) {
+            return noUpdate(5);
+        }
+        const running = collection === "running";
+        let status;
+        if (running) {
+            status = statusText("▶️ Collection Running", "green");
+        } else if (collection === "paused") {
+            status = statusText("⏸️ Collection Paused", "orange");
+        } else {
+            status = statusText("⏹️ Collection Stopped", "gray");
+        }
+        return changedOnly("collection", [
+            status,
+            running,
+            !running,
+            BUTTON_STYLES.startCollection[running],
+            BUTTON_STYLES.pauseCollection[!running],
+        ]);
+    }
+
+    // Plot interval last set on this page; starts at the layout's "live" one
+    let currentInterval = null;
+
+    function tickInterval(status, collection, source) {
+        if (!status || !collection || !source) {
+            return window.dash_clientside.no_update;
+        }
+        let interval;
+        if (collection === "running" && status.connection === "connected") {
+            interval = source.intervals.live;
+        } else if (collection === "paused") {
+            interval = source.intervals.paused;
+        } else {
+            interval = source.intervals.idle;
+        }
+        if (currentInterval === null) {
+            currentInterval = source.intervals.live;
+        }
+        if (interval === currentInterval) {
+            return window.dash_clientside.no_update;
+        }
+        currentInterval = interval;
+        return interval;
+    }
+
+    // Interval tick still waiting for an animation frame, if any
+    let pendingTick = null;
+
+    function frameTick(nIntervals) {
+        if (pendingTick !== null) {
+            // The previous tick has not been delivered yet (e.g. hidden tab);
+            // let it carry the newest count instead of queueing another
+            pendingTick.n = nIntervals;
+            return window.dash_clientside.no_update;
+        }
+        pendingTick = {n: nIntervals};
+        return new Promise(function (resolve) {
+            window.requestAnimationFrame(function () {
+                const tick = pendingTick.n;
+                pendingTick = null;
+                resolve(tick);
+            });
+        });
+    }
+
+    window.dash_clientside = Object.assign({}, window.dash_clientside, {
+        osc: {
+            applyView: applyView,
+            renderConnection: renderConnection,
+            renderRecording: renderRecording,
+            renderCollection: renderCollection,
+            frameTick: frameTick,
+            tickInterval: tickInterval,
+        },
+    });
+})();
@@ -2,12 +2,38 @@
 Plot components and layouts for oscilloscope visualization.
 """
 
-from typing import List, Optional
+import math
+from typing import Any, Dict, List, Mapping, Optional, Tuple, Union
 
+import numpy as np
 import plotly.graph_objects as go  # type: ignore
+from dash import Patch  # type: ignore
 from plotly.subplots import make_subplots  # type: ignore
 
-from ..ble_receiver import ImuRow
+from ..ble_receiver import IMU_COLUMNS, ImuRow
+
+# Per-channel sample arrays keyed by IMU_COLUMNS name (DataBuffer columnar view).
+# This struct-of-arrays form is what the plotting code works on; row lists are
+# converted once at the create_multi_plot_layout boundary.
+Columns = Mapping[str, np.ndarray]
+
+# Channels drawn in each subplot, in trace order
+PLOT_CHANNELS: Dict[str, List[str]] = {
+    "accel": ["ax", "ay", "az"],
+    "gyro": ["gx", "gy", "gz"],
+    "temp": ["tempC"],
+    "audio": ["audioRMS"],
+}
+
+# Layout axis suffix of each subplot in the 2x2 grid ("" = xaxis/yaxis)
+_PLOT_AXES = {"accel": "", "gyro": "2", "temp": "3", "audio": "4"}
+
+# Y ranges used when auto-scale is off; mirrored in assets/osc.js
+FIXED_YAXIS_RANGES: Dict[str, List[float]] = {
+    "accel": [-2, 2],
+    "gyro": [-50, 50],
+    "audio": [0, 2000],
+}
 
 
 def create_accelerometer_plot(
@@ -307,13 +333,122 @@ def create_audio_plot(data: List[ImuRow], title: str = "Audio RMS") -> go.Figure
     return fig
 
 
+def trace_channels() -> List[str]:
+    """Return the channel of each trace in create_multi_plot_layout order."""
+    return [channel for channels in PLOT_CHANNELS.values() for channel in channels]
+
+
+# Row of the audio trace in _prep_traces() output
+_AUDIO_TRACE = trace_channels().index("audioRMS")
+
+
+def rows_to_columns(data: List[ImuRow]) -> Dict[str, np.ndarray]:
+    """Convert IMU rows into per-channel arrays."""
+    table = np.array(data, dtype=np.float64).reshape(len(data), len(IMU_COLUMNS))
+    # Transpose once so that every channel is a contiguous array
+    columns = np.ascontiguousarray(table.T)
+    return {name: columns[i] for i, name in enumerate(IMU_COLUMNS)}
+
+
+def _downsample_minmax(
+    x: np.ndarray, y: np.ndarray, bucket_size: int
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Reduce each bucket of consecutive samples to its minimum and maximum.
+
+    Unlike keeping every Nth sample, this preserves peaks and dips however
+    short they are. Each complete bucket yields two points in time order, so
+    the output size is fixed by the number of buckets. NaN samples are ignored
+    unless the whole bucket is NaN.
+
+    Args:
+        x: Sample positions, shape (samples,).
+        y: Sample values, shape (channels, samples); all channels are reduced
+            in one pass.
+        bucket_size: Samples per bucket; 1 returns the input unchanged.
+
+    Returns:
+        tuple of (x, y) arrays of the selected points, both shaped
+        (channels, points) since each channel picks its own positions.
+    """
+    if bucket_size <= 1:
+        return np.broadcast_to(x, y.shape), y
+    n_buckets = y.shape[1] // bucket_size
+    size = n_buckets * bucket_size
+    x_buckets = x[:size].reshape(n_buckets, bucket_size)
+    y_buckets = y[:, :size].reshape(len(y), n_buckets, bucket_size)
+
+    missing = np.isnan(y_buckets)
+    low = np.where(missing, np.inf, y_buckets).argmin(axis=2)
+    high = np.where(missing, -np.inf, y_buckets).argmax(axis=2)
+    picks = np.sort(np.stack([low, high], axis=2), axis=2)
+    rows = np.arange(n_buckets)[None, :, None]
+    return (
+        x_buckets[rows, picks].reshape(len(y), -1),
+        np.take_along_axis(y_buckets, picks, axis=2).reshape(len(y), -1),
+    )
+
+
+def _prep_traces(
+    data: Columns, bucket_size: int, time_origin_millis: float
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Compute the points of every trace in trace_channels() order.
+
+    All channels are stacked into one matrix so that masking, bucketing and
+    time conversion run as a few whole-array operations per tick instead of
+    once per trace.
+
+    Returns:
+        tuple of (x, y) arrays shaped (traces, points); x is in seconds
+        relative to time_origin_millis.
+    """
+    values = np.stack([data[channel] for channel in trace_channels()])
+    # Missing audio values (-1.0) are excluded from buckets and drawn as gaps
+    audio = values[_AUDIO_TRACE]
+    audio[audio < 0] = np.nan
+    millis, values = _downsample_minmax(data["millis"], values, bucket_size)
+    return (millis - time_origin_millis) / 1000.0, values
+
+
+def _channel_values(values: np.ndarray) -> List[Any]:
+    """Convert channel values to a JSON-ready list, mapping NaN to gaps.
+
+    Plain lists are used rather than arrays: Plotly serializes arrays as typed
+    binary blobs, which Patch operations cannot extend in the browser.
+    """
+    missing = np.isnan(values)
+    if missing.any():
+        # None breaks the line instead of drawing a misleading value
+        with_gaps = values.astype(object)
+        with_gaps[missing] = None
+        return list(with_gaps.tolist())
+    return list(values.tolist())
+
+
+def _relative_seconds(millis: np.ndarray, time_origin_millis: float) -> List[float]:
+    """Convert device timestamps to seconds relative to the origin."""
+    return list(((millis - time_origin_millis) / 1000.0).tolist())
+
+
+def _padded_range(low: float, high: float, min_padding: float) -> List[float]:
+    """Return [low, high] widened by 10% of the span (at least min_padding)."""
+    padding = max(min_padding, (high - low) * 0.1)
+    return [low - padding, high + padding]
+
+
+def _temperature_range(low: float, high: float) -> List[float]:
+    """Temperature is always auto-scaled, padded by at least 1°C."""
+    return _padded_range(low, high, 1.0)
+
+
 def create_multi_plot_layout(
-    data: List[ImuRow],
+    data: Union[List[ImuRow], Columns],
     time_window_seconds: int = 20,
     visible_plots: List[str] = ["accel", "gyro", "temp", "audio"],
     auto_scale: bool = False,
     *,
     max_points_cap: Optional[int] = None,
+    time_origin_millis: Optional[int] = None,
+    bucket_size: Optional[int] = None,
 ) -> go.Figure:
     """Create comprehensive 2x2 sensor data visualization with intelligent scaling.
 
@@ -341,15 +476,28 @@ def create_multi_plot_layout(
        invalid readings from skewing visualizations or creating misleading trends.
 
     Args:
-        data: List of IMU sensor readings ordered chronologically. Empty list
-            results in "No data" placeholders in all subplots.
+        data: IMU sensor readings ordered chronologically, either as a list of
+            rows or as per-channel arrays (DataBuffer.get_recent_arrays()).
+            Empty data results in "No data" placeholders in all subplots.
         time_window_seconds: Duration of data to display. 0 means show all data.
             Default 20s provides ~500 samples at 25Hz, good for trend analysis.
         visible_plots: List of sensor types to display. Valid options:
-            ["accel", "gyro", "temp", "audio"]. Hidden plots are made invisible
-            but layout positions remain consistent.
-        auto_scale: If True, Y-axes scale to data range with padding. If False,
-            uses fixed ranges optimized for typical sensor behavior.
+            ["accel", "gyro", "temp", "audio"]. Hidden plots keep their traces
+            (visible=False) so the browser can toggle them without a rebuild;
+            layout positions remain consistent.
+        auto_scale: If True, Y-axes use Plotly autorange. If False, uses fixed
+            ranges optimized for typical sensor behavior. Temperature is always
+            scaled to its data.
+        max_points_cap: Optional upper bound on the number of points drawn per
+            trace. Longer data is reduced with min/max buckets rather than
+            truncated, so the whole time window stays visible.
+        time_origin_millis: Device time that maps to x=0. Defaults to the first
+            sample; pass a fixed origin when the figure is later extended with
+            create_plot_patch so that appended samples share the same x scale.
+        bucket_size: Explicit min/max bucket size, overriding the one derived
+            from max_points_cap. The data must then start at a bucket boundary
+            (see DataBuffer.get_recent_arrays(align=...)) so that later patches
+            continue the same buckets.
 
     Returns:
         go.Figure: Plotly figure with 2x2 subplot layout:
@@ -361,29 +509,48 @@ def create_multi_plot_layout(
     Note:
         The function handles edge cases gracefully:
         - Empty data: Shows "No data" message in all subplots
-        - Missing audio: Filters out -1.0 values to prevent visualization artifacts
-        - Time synchronization: All plots use relative timestamps from first sample
+        - Missing audio: -1.0 values become gaps to prevent visualization artifacts
+        - Time synchronization: All plots use relative timestamps from one origin
+
+        Every channel gets exactly one trace, ordered as returned by
+        trace_channels() and tagged with meta={"plot": name}, so all traces
+        have the same number of points (one per sample, or two per bucket when
+        downsampled; each trace has its own x values in that case). The
+        oscilloscope's osc.applyView clientside callback relies on this
+        structure.
 
         Performance is optimized for real-time updates with large datasets by
         limiting sample count based on time window and expected data rates.
     """
-    # Filter data based on time window and apply optional cap for performance
-    if data and time_window_seconds > 0:
+    if isinstance(data, list):
+        data = rows_to_columns(data)
+    sample_count = len(data["millis"])
+
+    # Filter data based on time window
+    if sample_count and time_window_seconds > 0:
         sample_rate = 25  # Hz, approximate
         max_samples = int(time_window_seconds * sample_rate)
-        if max_points_cap is not None:
-            max_samples = min(max_samples, max_points_cap)
-        if len(data) > max_samples:
-            data = data[-max_samples:]
+        if sample_count > max_samples:
+            data = {name: values[-max_samples:] for name, values in data.items()}
+            sample_count = max_samples
+
+    # Apply the optional point cap by min/max bucketing
+    if bucket_size is None:
+        bucket_size = 1
+        if max_points_cap is not None and sample_count > max_points_cap:
+            bucket_size = math.ceil(sample_count / max(1, max_points_cap // 2))
+            # Drop the oldest partial bucket so every bucket is complete
+            skip = sample_count % bucket_size
+            data = {name: values[skip:] for name, values in data.items()}
 
     fig = make_subplots(
         rows=2,
         cols=2,
         subplot_titles=(
-            "Accelerometer Data (g)" if "accel" in visible_plots else "",
-            "Gyroscope Data (°/s)" if "gyro" in visible_plots else "",
-            "Temperature (°C)" if "temp" in visible_plots else "",
-            "Audio RMS Level" if "audio" in visible_plots else "",
+            "Accelerometer Data (g)",
+            "Gyroscope Data (°/s)",
+            "Temperature (°C)",
+            "Audio RMS Level",
         ),
         specs=[
             [{"secondary_y": False}, {"secondary_y": False}],
@@ -393,7 +560,11 @@ def create_multi_plot_layout(
         horizontal_spacing=0.10,
     )
 
-    if not data:
+    # Name the subplot titles so the browser can hide them with their plot
+    for annotation, plot_name in zip(fig.layout.annotations, PLOT_CHANNELS):
+        annotation.update(name=plot_name, visible=plot_name in visible_plots)
+
+    if not sample_count:
         # Add "No data" annotations to all subplots
         for row in [1, 2]:
             for col in [1, 2]:
@@ -413,221 +584,120 @@ def create_multi_plot_layout(
         return fig
 
     # Calculate relative timestamps
-    timestamps = [(row.millis - data[0].millis) / 1000.0 for row in data]
+    origin = (
+        int(data["millis"][0]) if time_origin_millis is None else time_origin_millis
+    )
+    x_range = _relative_seconds(data["millis"][[0, -1]], origin)
 
-    # Accelerometer data (top-left)
-    if "accel" in visible_plots:
-        ax_data = [row.ax for row in data]
-        ay_data = [row.ay for row in data]
-        az_data = [row.az for row in data]
+    trace_x, trace_y = _prep_traces(data, bucket_size, origin)
+    trace_index = {channel: i for i, channel in enumerate(trace_channels())}
 
-        # WebGLで描画負荷を軽減
-        fig.add_trace(
-            go.Scattergl(
-                x=timestamps,
-                y=ax_data,
-                mode="lines",
-                name="X-axis",
-                line=dict(color="red", width=1.5),
-            ),
-            row=1,
-            col=1,
-        )
-        fig.add_trace(
-            go.Scattergl(
-                x=timestamps,
-                y=ay_data,
-                mode="lines",
-                name="Y-axis",
-                line=dict(color="green", width=1.5),
-            ),
-            row=1,
-            col=1,
-        )
+    def series(channel: str) -> Dict[str, List[Any]]:
+        i = trace_index[channel]
+        return {"x": trace_x[i].tolist(), "y": _channel_values(trace_y[i])}
+
+    # Accelerometer data (top-left)
+    # WebGLで描画負荷を軽減
+    for channel, name, color in [
+        ("ax", "X-axis", "red"),
+        ("ay", "Y-axis", "green"),
+        ("az", "Z-axis", "blue"),
+    ]:
         fig.add_trace(
             go.Scattergl(
-                x=timestamps,
-                y=az_data,
+                **series(channel),
                 mode="lines",
-                name="Z-axis",
-                line=dict(color="blue", width=1.5),
+                name=name,
+                line=dict(color=color, width=1.5),
+                meta={"plot": "accel"},
+                visible="accel" in visible_plots,
             ),
             row=1,
             col=1,
         )
 
     # Gyroscope data (top-right)
-    if "gyro" in visible_plots:
-        gx_data = [row.gx for row in data]
-        gy_data = [row.gy for row in data]
-        gz_data = [row.gz for row in data]
-
-        fig.add_trace(
-            go.Scattergl(
-                x=timestamps,
-                y=gx_data,
-                mode="lines",
-                name="X-rotation",
-                line=dict(color="darkred", width=1.5),
-                showlegend=False,
-            ),
-            row=1,
-            col=2,
-        )
-        fig.add_trace(
-            go.Scattergl(
-                x=timestamps,
-                y=gy_data,
-                mode="lines",
-                name="Y-rotation",
-                line=dict(color="darkgreen", width=1.5),
-                showlegend=False,
-            ),
-            row=1,
-            col=2,
-        )
+    for channel, name, color in [
+        ("gx", "X-rotation", "darkred"),
+        ("gy", "Y-rotation", "darkgreen"),
+        ("gz", "Z-rotation", "darkblue"),
+    ]:
         fig.add_trace(
             go.Scattergl(
-                x=timestamps,
-                y=gz_data,
+                **series(channel),
                 mode="lines",
-                name="Z-rotation",
-                line=dict(color="darkblue", width=1.5),
+                name=name,
+                line=dict(color=color, width=1.5),
                 showlegend=False,
+                meta={"plot": "gyro"},
+                visible="gyro" in visible_plots,
             ),
             row=1,
             col=2,
         )
 
     # Temperature data (bottom-left)
-    if "temp" in visible_plots:
-        temp_data = [row.tempC for row in data]
-        fig.add_trace(
-            go.Scatter(
-                x=timestamps,
-                y=temp_data,
-                mode="lines",
-                name="Temperature",
-                line=dict(color="orange", width=2),
-                showlegend=False,
-            ),
-            row=2,
-            col=1,
-        )
+    fig.add_trace(
+        go.Scatter(
+            **series("tempC"),
+            mode="lines",
+            name="Temperature",
+            line=dict(color="orange", width=2),
+            showlegend=False,
+            meta={"plot": "temp"},
+            visible="temp" in visible_plots,
+        ),
+        row=2,
+        col=1,
+    )
 
-    # Audio data (bottom-right) - filter out missing values
-    if "audio" in visible_plots:
-        audio_timestamps: List[float] = []
-        audio_data: List[float] = []
-        for idx, imu_row in enumerate(data):
-            if imu_row.audioRMS >= 0:  # Filter out missing values (-1.0)
-                audio_timestamps.append(timestamps[idx])
-                audio_data.append(imu_row.audioRMS)
-
-        if audio_data:
-            fig.add_trace(
-                go.Scatter(
-                    x=audio_timestamps,
-                    y=audio_data,
-                    mode="lines",
-                    name="Audio RMS",
-                    line=dict(color="purple", width=2),
-                    connectgaps=False,
-                    showlegend=False,
-                ),
-                row=2,
-                col=2,
-            )
+    # Audio data (bottom-right) - missing values are drawn as gaps
+    fig.add_trace(
+        go.Scatter(
+            **series("audioRMS"),
+            mode="lines",
+            name="Audio RMS",
+            line=dict(color="purple", width=2),
+            connectgaps=False,
+            showlegend=False,
+            meta={"plot": "audio"},
+            visible="audio" in visible_plots,
+        ),
+        row=2,
+        col=2,
+    )
 
     # Update axis ranges and labels
-    if timestamps:
-        fig.update_xaxes(
-            range=[timestamps[0], timestamps[-1]], title_text="Time (seconds)"
-        )
+    fig.update_xaxes(range=x_range, title_text="Time (seconds)")
 
     # Set Y-axis ranges based on auto_scale setting
-    if "accel" in visible_plots:
-        if auto_scale and data:
-            all_accel = (
-                [row.ax for row in data]
-                + [row.ay for row in data]
-                + [row.az for row in data]
-            )
-            accel_min, accel_max = min(all_accel), max(all_accel)
-            accel_range = accel_max - accel_min
-            padding = max(0.1, accel_range * 0.1)
-            fig.update_yaxes(
-                range=[accel_min - padding, accel_max + padding],
-                title_text="Acceleration (g)",
-                row=1,
-                col=1,
-            )
-        else:
-            fig.update_yaxes(range=[-2, 2], title_text="Acceleration (g)", row=1, col=1)
-
-    if "gyro" in visible_plots:
-        if auto_scale and data:
-            all_gyro = (
-                [row.gx for row in data]
-                + [row.gy for row in data]
-                + [row.gz for row in data]
-            )
-            gyro_min, gyro_max = min(all_gyro), max(all_gyro)
-            gyro_range = gyro_max - gyro_min
-            padding = max(5.0, gyro_range * 0.1)
-            fig.update_yaxes(
-                range=[gyro_min - padding, gyro_max + padding],
-                title_text="Angular Velocity (°/s)",
-                row=1,
-                col=2,
+    y_titles = {
+        "accel": "Acceleration (g)",
+        "gyro": "Angular Velocity (°/s)",
+        "temp": "Temperature (°C)",
+        "audio": "RMS Level",
+    }
+    grid = {"accel": (1, 1), "gyro": (1, 2), "temp": (2, 1), "audio": (2, 2)}
+    for plot_name, (row, col) in grid.items():
+        if plot_name == "temp":
+            temps = data["tempC"]
+            y_range: Optional[List[float]] = _temperature_range(
+                float(temps.min()), float(temps.max())
             )
+        elif auto_scale:
+            y_range = None
         else:
-            fig.update_yaxes(
-                range=[-50, 50], title_text="Angular Velocity (°/s)", row=1, col=2
-            )
-
-    # Temperature - always auto-scale for better readability
-    if "temp" in visible_plots and data:
-        temp_data = [row.tempC for row in data]
-        if temp_data:
-            temp_min, temp_max = min(temp_data), max(temp_data)
-            temp_range = temp_max - temp_min
-            padding = max(1.0, temp_range * 0.1)
-            fig.update_yaxes(
-                range=[temp_min - padding, temp_max + padding],
-                title_text="Temperature (°C)",
-                row=2,
-                col=1,
-            )
-
-    # Audio - auto-scale based on setting
-    if "audio" in visible_plots:
-        if data:
-            audio_data = [row.audioRMS for row in data if row.audioRMS >= 0]
-            if audio_data:
-                if auto_scale:
-                    audio_min, audio_max = min(audio_data), max(audio_data)
-                    audio_range = audio_max - audio_min
-                    padding = max(50.0, audio_range * 0.1)
-                    fig.update_yaxes(
-                        range=[max(0, audio_min - padding), audio_max + padding],
-                        title_text="RMS Level",
-                        row=2,
-                        col=2,
-                    )
-                else:
-                    fig.update_yaxes(
-                        range=[0, 2000], title_text="RMS Level", row=2, col=2
-                    )
-            else:
-                fig.update_yaxes(range=[0, 2000], title_text="RMS Level", row=2, col=2)
-        else:
-            fig.update_yaxes(range=[0, 2000], title_text="RMS Level", row=2, col=2)
+            y_range = FIXED_YAXIS_RANGES[plot_name]
+        fig.update_yaxes(
+            range=y_range,
+            autorange=y_range is None,
+            title_text=y_titles[plot_name],
+            row=row,
+            col=col,
+        )
 
     # Hide empty subplots
-    for i, (plot_name, row, col) in enumerate(
-        [("accel", 1, 1), ("gyro", 1, 2), ("temp", 2, 1), ("audio", 2, 2)]
-    ):
+    for plot_name, (row, col) in grid.items():
         if plot_name not in visible_plots:
             # Hide subplot by making it transparent and removing axes
             fig.update_xaxes(visible=False, row=row, col=col)
@@ -644,3 +714,58 @@ def create_multi_plot_layout(
     )
 
     return fig
+
+
+def create_plot_patch(
+    new_data: Columns,
+    extents: Mapping[str, Tuple[float, float]],
+    *,
+    time_origin_millis: int,
+    trim_count: int = 0,
+    bucket_size: int = 1,
+) -> Patch:
+    """Create a partial update that appends samples to a multi-plot figure.
+
+    Instead of rebuilding and re-sending the whole figure, only the new
+    samples are shipped to the browser. The oldest trim_count points are
+    removed from every trace so the display keeps a fixed-length window, and
+    the X and temperature ranges are refreshed to follow it. Visibility and
+    auto-scaling are left to the browser.
+
+    Args:
+        new_data: Per-channel arrays of samples not yet shown. With
+            bucket_size > 1 this must be whole buckets.
+        extents: Per-channel (min, max) over all samples that should be visible
+            after the update (DataBuffer.get_arrays_since()); used for the axis
+            ranges. Ranges are left unchanged when it is empty.
+        time_origin_millis: Origin the figure was built with.
+        trim_count: Number of points to drop from the start of every trace.
+        bucket_size: Min/max bucket size the figure was built with.
+
+    Returns:
+        Patch: Dash partial property update for the figure.
+
+    Note:
+        The figure must have been created by create_multi_plot_layout with the
+        same time_origin_millis, and must contain data.
+    """
+    patched = Patch()
+
+    trace_x, trace_y = _prep_traces(new_data, bucket_size, time_origin_millis)
+    for index, (x, y) in enumerate(zip(trace_x, trace_y)):
+        trace = patched["data"][index]
+        trace["x"].extend(x.tolist())
+        trace["y"].extend(_channel_values(y))
+        for _ in range(trim_count):
+            del trace["x"][0]
+            del trace["y"][0]
+
+    if extents:
+        x_range = _relative_seconds(np.array(extents["millis"]), time_origin_millis)
+        for suffix in _PLOT_AXES.values():
+            patched["layout"][f"xaxis{suffix}"]["range"] = x_range
+        patched["layout"][f"yaxis{_PLOT_AXES['temp']}"]["range"] = _temperature_range(
+            *extents["tempC"]
+        )
+
+    return patched
@@ -0,0 +1,233 @@
+"""Tests for the BLE receiver: ring buffer, line parsing and streaming."""
+
+import asyncio
+from collections import deque
+from typing import Any, AsyncIterator, Optional
+
+import numpy as np
+import pytest
+
+from xiao_nrf52840_sense_receiver import ble_receiver
+from xiao_nrf52840_sense_receiver.ble_receiver import (
+    IMU_COLUMNS,
+    DataBuffer,
+    ImuRow,
+    _create_notification_handler,
+    _parse_line_from_buffer,
+    _ParseState,
+    stream_batches,
+)
+
+LINE = b"1000,0.1,0.2,0.3,1.0,2.0,3.0,25.00,12.5\n"
+
+
+def _drain(queue: "asyncio.Queue[Optional[str]]") -> list[Optional[str]]:
+    items = []
+    while not queue.empty():
+        items.append(queue.get_nowait())
+    return items
+
+
+def test_disconnect_sentinel_survives_a_full_queue() -> None:
+    queue: asyncio.Queue[Optional[str]] = asyncio.Queue(maxsize=2)
+    disconnected = asyncio.Event()
+    handle = _create_notification_handler(queue, _ParseState(), disconnected)
+    characteristic: Any = None
+
+    handle(characteristic, bytearray(LINE * 3))  # Third line is dropped
+    assert queue.full()
+
+    disconnected.set()
+    handle(characteristic, bytearray(LINE))
+    handle(characteristic, bytearray(LINE))
+
+    items = _drain(queue)
+    assert items[-1] is None
+    assert items.count(None) == 1
+
+
+def _row(i: int) -> ImuRow:
+    return ImuRow(i * 40, i * 0.5, -i, 1.0 / (i + 1), 2.0, -3.5, i * 1e-3, 25.0, i % 3)
+
+
+class _ReferenceBuffer:
+    """deque-based model of DataBuffer's documented behavior."""
+
+    def __init__(self, max_size: int) -> None:
+        self.rows: deque[ImuRow] = deque(maxlen=max_size)
+        self.written = 0
+
+    def add(self, rows: list[ImuRow]) -> None:
+        self.rows.extend(rows)
+        self.written += len(rows)
+
+    @property
+    def base(self) -> int:
+        return self.written - len(self.rows)
+
+    def between(self, start: int, end: int) -> list[ImuRow]:
+        return list(self.rows)[start - self.base : end - self.base]
+
+
+def _check_against_reference(
+    buffer: DataBuffer, ref: _ReferenceBuffer, last_index: int
+) -> None:
+    max_size = buffer.max_size
+    assert buffer.get_all() == list(ref.rows)
+    assert buffer.get_recent(0) == []
+    for count in (1, 3, max_size - 1, max_size, max_size + 5):
+        assert buffer.get_recent(count) == list(ref.rows)[-count:]
+
+    rows, next_index, dropped = buffer.get_since_index(last_index)
+    assert next_index == ref.written
+    assert dropped == (last_index < ref.base)
+    assert rows == ref.between(max(last_index, ref.base), ref.written)
+
+    for count, align in ((max_size, 1), (5, 1), (max_size, 2), (7, 3)):
+        new, extents, start, end = buffer.get_arrays_since(last_index, count, align)
+        expected_end = ref.written - ref.written % align
+        expected_start = max(ref.base, expected_end - count)
+        expected_start = min(expected_start + (-expected_start) % align, expected_end)
+        assert (start, end) == (expected_start, expected_end)
+
+        new_rows = ref.between(min(max(last_index, start), end), end)
+        window = np.array(ref.between(start, end), dtype=np.float64).reshape(-1, 9)
+        for i, name in enumerate(IMU_COLUMNS):
+            np.testing.assert_array_equal(new[name], [row[i] for row in new_rows])
+            if len(window):
+                lo, hi = window[:, i].min(), window[:, i].max()
+                assert extents[name] == (lo, hi)
+        if not len(window):
+            assert extents == {}
+
+
+@pytest.mark.parametrize("batch_sizes", [[1], [3, 1, 5], [11], [2, 20, 1, 7]])
+def test_data_buffer_matches_deque_reference_across_wraparound(
+    batch_sizes: list[int],
+) -> None:
+    max_size = 8
+    buffer = DataBuffer(max_size=max_size)
+    ref = _ReferenceBuffer(max_size)
+    _check_against_reference(buffer, ref, last_index=0)
+
+    last_index = 0
+    i = 0
+    for step in range(12):
+        size = batch_sizes[step % len(batch_sizes)]
+        rows = [_row(i + k) for k in range(size)]
+        i += size
+        if size == 1:
+            buffer.append(rows[0])
+        else:
+            buffer.extend(rows)
+        ref.add(rows)
+
+        _check_against_reference(buffer, ref, last_index)
+        if step % 2:
+            last_index = ref.written  # Keep up on odd steps, fall behind on even
+
+    assert buffer.size == len(ref.rows) == max_size
+    assert buffer.current_write_index == ref.written
+
+
+def _feed(state: _ParseState, chunk: bytes) -> list[str]:
+    """Append one notification and parse lines the way the handler does."""
+    state.buffer.extend(chunk)
+    lines = []
+    while (text := _parse_line_from_buffer(state)) is not None:
+        lines.append(text)
+    return lines
+
+
+def test_line_split_across_notifications() -> None:
+    state = _ParseState()
+    assert _feed(state, b"1000,0.1,0.2") == []
+    assert state.scan_offset == len(state.buffer)
+    assert _feed(state, b",0.3,1.0,2.0,3.0,25") == []
+    assert _feed(state, b".00,12.5\n2000,") == [
+        "1000,0.1,0.2,0.3,1.0,2.0,3.0,25.00,12.5"
+    ]
+    # A match resets the offset: the remainder has not been searched yet
+    assert state.buffer == bytearray(b"2000,")
+    assert state.scan_offset == len(state.buffer)
+
+
+def test_crlf_split_across_notifications() -> None:
+    state = _ParseState()
+    assert _feed(state, b"a,1\r") == ["a,1"]
+    # The LF arrives alone and forms an empty line, which must not hold back
+    # the lines after it
+    assert _feed(state, b"\nb,2\r\nc,3\r") == ["b,2", "c,3"]
+    assert state.buffer == bytearray()
+
+
+def test_scan_offset_resets_after_match() -> None:
+    state = _ParseState()
+    _feed(state, b"abc")
+    assert state.scan_offset == 3
+    assert _feed(state, b"\x1edef") == ["abc"]
+    assert state.scan_offset == 3
+    assert _feed(state, b"\x00") == ["def"]
+    assert state.scan_offset == 0
+
+
+@pytest.mark.parametrize("noise", [b"\n", b" \t\n", b",,,\n", b" , \r\n", b"\x00\x04"])
+def test_noise_lines_are_skipped(noise: bytes) -> None:
+    state = _ParseState()
+    assert _feed(state, noise + b"x,1\n" + noise + b"y,2\n") == ["x,1", "y,2"]
+
+
+def test_undecodable_line_is_skipped() -> None:
+    state = _ParseState()
+    assert _feed(state, b"\xff\xfe\nx,1\n") == ["x,1"]
+
+
+@pytest.fixture
+def bursts(monkeypatch: pytest.MonkeyPatch) -> list[list[ImuRow]]:
+    """Replace the BLE connection with a fixed sequence of received bursts."""
+    received: list[list[ImuRow]] = []
+
+    async def fake_stream(*args: Any) -> AsyncIterator[list[ImuRow]]:
+        for rows in received:
+            yield rows
+
+    monkeypatch.setattr(ble_receiver, "_stream_row_batches", fake_stream)
+    return received
+
+
+@pytest.mark.anyio
+async def test_stream_batches_splits_long_bursts(bursts: list[list[ImuRow]]) -> None:
+    bursts.extend(
+        [[_row(i) for i in range(10)], [_row(10)], [_row(i) for i in range(11, 14)]]
+    )
+
+    sizes = [len(millis) async for millis, _ in stream_batches(batch_size=4)]
+
+    assert sizes == [4, 4, 2, 1, 3]
+
+
+@pytest.mark.anyio
+async def test_stream_batches_yields_millis_and_data_arrays(
+    bursts: list[list[ImuRow]],
+) -> None:
+    rows = [_row(i) for i in range(5)]
+    bursts.append(rows)
+
+    batches = [batch async for batch in stream_batches()]
+
+    assert len(batches) == 1
+    millis, data = batches[0]
+    assert millis.dtype == np.int64 and millis.shape == (5,)
+    assert data.dtype == np.float64 and data.shape == (5, 8)
+    np.testing.assert_array_equal(millis, [row.millis for row in rows])
+    np.testing.assert_array_equal(data, [row[1:] for row in rows])
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("batch_size", [0, -1])
+async def test_stream_batches_rejects_non_positive_batch_size(
+    bursts: list[list[ImuRow]], batch_size: int
+) -> None:
+    with pytest.raises(ValueError, match="batch_size"):
+        async for _ in stream_batches(batch_size=batch_size):
+            pass
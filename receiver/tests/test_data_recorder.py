@@ -0,0 +1,282 @@
+"""Tests for the recording file writer and recorder manager."""
+
+import json
+import logging
+import os
+import threading
+from pathlib import Path
+from typing import Optional
+
+import pytest
+
+from xiao_nrf52840_sense_receiver import data_recorder
+from xiao_nrf52840_sense_receiver.ble_receiver import DataBuffer, ImuRow
+from xiao_nrf52840_sense_receiver.data_recorder import (
+    RecorderManager,
+    RecordFileWriter,
+)
+
+
+def _rows(count: int) -> list[ImuRow]:
+    return [
+        ImuRow(
+            i * 40,
+            0.001 * i,
+            -0.5 + i / 7,
+            1.0 / (i + 1),
+            12.5 - i,
+            i * 0.333,
+            -3.25,
+            24.0 + i / 100,
+            -1.0 if i % 5 == 0 else 100.0 / (i + 3),
+        )
+        for i in range(count)
+    ]
+
+
+@pytest.mark.skipif(not hasattr(os, "posix_fadvise"), reason="needs posix_fadvise")
+def test_fadvise_failure_is_not_reported_as_fsync_failure(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, caplog: pytest.LogCaptureFixture
+) -> None:
+    writer = RecordFileWriter(tmp_path / "rec.csv")
+    writer.open()
+    writer.append_rows(_rows(10))
+
+    def failing_fadvise(fd: int, offset: int, length: int, advice: int) -> None:
+        raise OSError("fadvise not supported")
+
+    monkeypatch.setattr(data_recorder.os, "posix_fadvise", failing_fadvise)
+    with caplog.at_level(logging.DEBUG, logger=data_recorder.__name__):
+        writer.flush(force_fsync=True)
+    writer.close()
+
+    assert "fsync failed" not in caplog.text
+    assert "posix_fadvise(DONTNEED) failed" in caplog.text
+
+
+def _record(
+    path: Path,
+    rows: list[ImuRow],
+    compression: Optional[str] = None,
+    binary_spool: bool = False,
+) -> Path:
+    writer = RecordFileWriter(
+        path, buffer_size=16, compression=compression, binary_spool=binary_spool
+    )
+    writer.open()
+    for start in range(0, len(rows), 7):
+        writer.append_rows(rows[start : start + 7])
+    file_path = writer.close().file_path
+    assert writer.wait_transcoded(timeout=10.0)
+    return file_path
+
+
+def test_zstd_recording_matches_plain_csv(tmp_path: Path) -> None:
+    zstandard = pytest.importorskip("zstandard")
+    rows = _rows(100)
+
+    plain = _record(tmp_path / "plain.csv", rows)
+    compressed = _record(tmp_path / "packed.csv", rows, compression="zstd")
+
+    assert compressed.name == "packed.csv.zst"
+    with open(compressed, "rb") as f:
+        decompressed = zstandard.ZstdDecompressor().stream_reader(f).read()
+    assert decompressed == plain.read_bytes()
+
+
+def test_zstd_falls_back_to_plain_csv_without_zstandard(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, caplog: pytest.LogCaptureFixture
+) -> None:
+    monkeypatch.setattr(data_recorder, "zstandard", None)
+    rows = _rows(20)
+
+    with caplog.at_level(logging.WARNING, logger=data_recorder.__name__):
+        path = _record(tmp_path / "rec.csv", rows, compression="zstd")
+
+    assert path.name == "rec.csv"
+    assert path.read_bytes() == _record(tmp_path / "plain.csv", rows).read_bytes()
+    assert "zstandard is not installed" in caplog.text
+
+
+@pytest.mark.skipif(not hasattr(os, "writev"), reason="needs os.writev")
+def test_close_releases_file_after_write_failure(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    def failing_writev(fd: int, buffers: object) -> int:
+        raise OSError("disk full")
+
+    monkeypatch.setattr(data_recorder.os, "writev", failing_writev)
+    writer = RecordFileWriter(tmp_path / "rec.csv", buffer_size=4)
+    writer.open()
+    handle = writer._file_handle
+    assert handle is not None
+    writer.append_rows(_rows(10))
+
+    with pytest.raises(OSError, match="disk full"):
+        writer.close()
+    assert handle.closed
+
+
+def test_binary_spool_matches_direct_csv(tmp_path: Path) -> None:
+    rows = _rows(100)
+
+    direct = _record(tmp_path / "direct.csv", rows)
+    spooled = _record(tmp_path / "spooled.csv", rows, binary_spool=True)
+
+    assert spooled.read_bytes() == direct.read_bytes()
+    assert not spooled.with_name("spooled.csv.spool").exists()
+    metadata = json.loads(spooled.with_suffix(".meta.json").read_text())
+    assert metadata["total_samples"] == 100
+    assert metadata["file_size_bytes"] == spooled.stat().st_size
+
+
+def test_binary_spool_with_zstd_matches_direct_csv(tmp_path: Path) -> None:
+    zstandard = pytest.importorskip("zstandard")
+    rows = _rows(100)
+
+    direct = _record(tmp_path / "direct.csv", rows)
+    spooled = _record(
+        tmp_path / "spooled.csv", rows, compression="zstd", binary_spool=True
+    )
+
+    assert spooled.name == "spooled.csv.zst"
+    with open(spooled, "rb") as f:
+        decompressed = zstandard.ZstdDecompressor().stream_reader(f).read()
+    assert decompressed == direct.read_bytes()
+
+
+def test_stop_does_not_close_writer_under_a_stuck_worker(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(data_recorder, "WORKER_STOP_TIMEOUT", 0.1)
+    entered = threading.Event()
+    release = threading.Event()
+    original_append = RecordFileWriter.append_rows
+
+    def slow_append(self: RecordFileWriter, samples: list[ImuRow]) -> None:
+        entered.set()
+        release.wait(10.0)  # A disk write that outlives the stop timeout
+        original_append(self, samples)
+
+    monkeypatch.setattr(RecordFileWriter, "append_rows", slow_append)
+    buffer = DataBuffer(max_size=100)
+    manager = RecorderManager(buffer, tmp_path)
+    manager.start_recording()
+    writer = manager._file_writer
+    worker = manager._worker_thread
+    assert writer is not None and worker is not None
+
+    buffer.extend(_rows(5))
+    assert entered.wait(5.0)
+    with pytest.raises(RuntimeError, match="did not stop in time"):
+        manager.stop_recording()
+
+    # Still writing: the manager must not have closed the file under it
+    assert writer._file_handle is not None
+    assert not manager.is_recording
+
+    release.set()
+    worker.join(5.0)
+    assert writer._file_handle is None
+    csv_path = writer._filepath
+    assert csv_path.read_text().count("\n") == 1 + 5
+    assert csv_path.with_suffix(".meta.json").exists()
+
+
+@pytest.mark.skipif(not hasattr(os, "writev"), reason="needs os.writev")
+def test_close_does_not_close_file_under_a_stuck_flusher(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(data_recorder, "FLUSHER_STOP_TIMEOUT", 0.1)
+    entered = threading.Event()
+    release = threading.Event()
+    real_writev = os.writev
+
+    def slow_writev(fd: int, buffers: list[memoryview]) -> int:
+        entered.set()
+        release.wait(10.0)  # A stalled disk
+        return real_writev(fd, buffers)
+
+    monkeypatch.setattr(data_recorder.os, "writev", slow_writev)
+    writer = RecordFileWriter(tmp_path / "rec.csv", buffer_size=4)
+    writer.open()
+    handle = writer._file_handle
+    flusher = writer._flusher
+    assert handle is not None and flusher is not None
+    writer.append_rows(_rows(10))
+    assert entered.wait(5.0)
+
+    with pytest.raises(RuntimeError, match="did not stop in time"):
+        writer.close()
+    assert not handle.closed
+
+    release.set()
+    flusher.join(5.0)
+    assert handle.closed
+    assert (tmp_path / "rec.csv").read_text().count("\n") == 1 + 10
+
+
+@pytest.mark.skipif(not hasattr(os, "writev"), reason="needs os.writev")
+def test_late_flusher_write_does_not_reach_a_reused_descriptor(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(data_recorder, "FLUSHER_STOP_TIMEOUT", 0.1)
+    entered = threading.Event()
+    release = threading.Event()
+    real_writev = os.writev
+
+    def slow_writev(fd: int, buffers: list[memoryview]) -> int:
+        entered.set()
+        release.wait(10.0)
+        return real_writev(fd, buffers)
+
+    monkeypatch.setattr(data_recorder.os, "writev", slow_writev)
+    writer = RecordFileWriter(tmp_path / "rec.csv", buffer_size=4)
+    writer.open()
+    flusher = writer._flusher
+    assert flusher is not None
+    writer.append_rows(_rows(10))
+    assert entered.wait(5.0)
+    with pytest.raises(RuntimeError):
+        writer.close()
+
+    # A file opened right after close() (like the metadata file) must not
+    # get the recording's descriptor number while the write is pending
+    with open(tmp_path / "other.txt", "w") as other:
+        other.write("unrelated\n")
+        release.set()
+        flusher.join(5.0)
+
+    assert (tmp_path / "other.txt").read_text() == "unrelated\n"
+    assert (tmp_path / "rec.csv").read_text().count("\n") == 1 + 10
+
+
+@pytest.mark.skipif(not hasattr(os, "posix_fadvise"), reason="needs posix_fadvise")
+def test_recording_drops_synced_pages_from_cache(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(data_recorder, "FSYNC_INTERVAL", 0.0)
+    advice: list[int] = []
+    real_fadvise = os.posix_fadvise
+
+    def recording_fadvise(fd: int, offset: int, length: int, hint: int) -> None:
+        advice.append(hint)
+        real_fadvise(fd, offset, length, hint)
+
+    monkeypatch.setattr(data_recorder.os, "posix_fadvise", recording_fadvise)
+    buffer = DataBuffer(max_size=100)
+    manager = RecorderManager(buffer, tmp_path)
+    manager.start_recording()
+
+    # Periodic forced flush from the worker while recording
+    buffer.extend(_rows(5))
+    for _ in range(100):
+        if os.POSIX_FADV_DONTNEED in advice:
+            break
+        threading.Event().wait(0.05)
+    assert os.POSIX_FADV_DONTNEED in advice
+
+    # Final forced flush from close()
+    advice.clear()
+    manager.stop_recording()
+    assert os.POSIX_FADV_DONTNEED in advice
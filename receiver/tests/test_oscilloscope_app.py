@@ -0,0 +1,81 @@
+"""Tests for the oscilloscope application wiring."""
+
+import threading
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from xiao_nrf52840_sense_receiver.ble_receiver import MockDataSource
+from xiao_nrf52840_sense_receiver.oscilloscope import OscilloscopeApp, create_app
+
+
+@pytest.fixture(autouse=True)
+def _recordings_in_tmp(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    # OscilloscopeApp creates ./recordings
+    monkeypatch.chdir(tmp_path)
+
+
+def test_record_compression_is_passed_to_recorder() -> None:
+    app = create_app(MockDataSource(), record_compression="zstd")
+
+    assert app.recorder._compression == "zstd"
+
+
+def test_record_binary_spool_is_passed_to_recorder() -> None:
+    app = create_app(MockDataSource(), record_binary_spool=True)
+
+    assert app.recorder._binary_spool
+
+
+def _collection_status(app: OscilloscopeApp) -> Any:
+    """Run the collection-store callback the way the browser does."""
+    response = app.app.server.test_client().post(
+        "/_dash-update-component",
+        json={
+            "output": "collection-store.data",
+            "outputs": {"id": "collection-store", "property": "data"},
+            "inputs": [
+                {"id": "collection-state-store", "property": "children", "value": None}
+            ],
+            "changedPropIds": [],
+        },
+    )
+    assert response.status_code == 200
+    return response.get_json()["response"]["collection-store"]["data"]
+
+
+def test_started_app_reports_collection_running() -> None:
+    app = create_app(MockDataSource())
+    assert _collection_status(app) == "stopped"
+
+    app.start_data_collection()
+    try:
+        # The plot interval only runs at full rate while this is "running"
+        assert _collection_status(app) == "running"
+    finally:
+        app.stop_data_collection()
+
+    assert _collection_status(app) == "stopped"
+
+
+def test_paused_collection_still_reports_connected() -> None:
+    app: OscilloscopeApp
+
+    class PausedAtConnect(MockDataSource):
+        async def start(self) -> None:
+            await super().start()
+            # The user paused before the first row arrived
+            app._collection_paused = True
+
+    app = create_app(PausedAtConnect())
+    app.start_data_collection()
+    try:
+        for _ in range(100):
+            if app._connection_state == "connected":
+                break
+            threading.Event().wait(0.05)
+        assert app._connection_state == "connected"
+        assert app.buffer.stats.fill_level == 0
+    finally:
+        app.stop_data_collection()
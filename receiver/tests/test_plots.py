@@ -0,0 +1,136 @@
+"""Tests for the oscilloscope figure builders."""
+
+import math
+from pathlib import Path
+from typing import Any, Dict, List
+
+import numpy as np
+import plotly.graph_objects as go
+import pytest
+from dash import Patch
+
+from xiao_nrf52840_sense_receiver.ble_receiver import ImuRow, MockDataSource
+from xiao_nrf52840_sense_receiver.oscilloscope import create_app
+from xiao_nrf52840_sense_receiver.oscilloscope.plots import (
+    _downsample_minmax,
+    create_multi_plot_layout,
+)
+
+
+@pytest.fixture(autouse=True)
+def _recordings_in_tmp(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    # OscilloscopeApp creates ./recordings
+    monkeypatch.chdir(tmp_path)
+
+
+def _rows(start: int, count: int) -> List[ImuRow]:
+    return [
+        ImuRow(
+            1000 + i * 40,
+            math.sin(i / 3),
+            math.cos(i / 5),
+            (i * 7919) % 13 / 13,
+            i % 17 - 8.0,
+            -(i % 11) * 1.5,
+            (i * 31) % 7 * 2.0,
+            24.0 + (i % 50) / 10,
+            -1.0 if i % 9 == 0 else float(i % 23),
+        )
+        for i in range(start, start + count)
+    ]
+
+
+def _apply_patch(figure: Dict[str, Any], patch: Patch) -> None:
+    """Apply Patch operations to a figure dict the way the browser does."""
+    for op in patch.to_plotly_json()["operations"]:
+        *path, last = op["location"]
+        target = figure
+        for key in path:
+            target = target.setdefault(key, {}) if isinstance(key, str) else target[key]
+        if op["operation"] == "Extend":
+            target[last].extend(op["params"]["value"])
+        elif op["operation"] == "Delete":
+            del target[last]
+        elif op["operation"] == "Assign":
+            target[last] = op["params"]["value"]
+        else:
+            raise AssertionError(f"unexpected patch operation {op['operation']}")
+
+
+@pytest.mark.parametrize("time_window", [10, 60])
+def test_patched_figure_matches_rebuilt_figure(time_window: int) -> None:
+    app = create_app(MockDataSource())
+    visible = ["accel", "gyro", "temp", "audio"]
+    window_samples, bucket_size = app._plot_window(time_window)
+    app.buffer.extend(_rows(0, window_samples + 3))
+    built, state = app._compute_plot_update(None, time_window, visible, False)
+    figure = built.to_dict()
+
+    patches = 0
+    sent = window_samples + 3
+    for count in [1, 37, 5, bucket_size * 3, 120, 2, 64, 201]:
+        app.buffer.extend(_rows(sent, count))
+        sent += count
+        update, new_state = app._compute_plot_update(state, time_window, visible, False)
+        if isinstance(update, Patch):
+            _apply_patch(figure, update)
+            patches += 1
+        elif isinstance(update, go.Figure):
+            figure = update.to_dict()
+        if isinstance(new_state, dict):
+            state = new_state
+
+        data, _, end = app.buffer.get_recent_arrays(window_samples, bucket_size)
+        expected = create_multi_plot_layout(
+            data,
+            time_window_seconds=0,
+            visible_plots=visible,
+            time_origin_millis=state["origin"],
+            bucket_size=bucket_size,
+        ).to_dict()
+        assert state["seq"] == end
+        assert figure == expected
+
+    assert patches >= 6
+
+
+def test_downsample_minmax_keeps_bucket_extrema() -> None:
+    rng = np.random.default_rng(0)
+    bucket_size = 7
+    x = np.arange(10.0, 10.0 + 7 * 20)
+    y = rng.normal(size=(3, len(x)))
+    y[1, 30:33] = np.nan
+
+    out_x, out_y = _downsample_minmax(x, y, bucket_size)
+
+    assert out_x.shape == out_y.shape == (3, 40)
+    for channel in range(3):
+        buckets = y[channel].reshape(20, bucket_size)
+        picked = out_y[channel].reshape(20, 2)
+        np.testing.assert_array_equal(picked.min(axis=1), np.nanmin(buckets, axis=1))
+        np.testing.assert_array_equal(picked.max(axis=1), np.nanmax(buckets, axis=1))
+        # Points stay in time order and keep their own positions
+        assert np.all(np.diff(out_x[channel]) > 0)
+        np.testing.assert_array_equal(
+            out_y[channel], y[channel][out_x[channel].astype(int) - 10]
+        )
+
+
+def test_downsample_minmax_keeps_first_and_last_points_when_extreme() -> None:
+    x = np.arange(8.0)
+    y = np.array([[5.0, 1, 2, 3, 1, 2, 3, -4]])
+
+    out_x, out_y = _downsample_minmax(x, y, 4)
+
+    np.testing.assert_array_equal(out_x, [[0, 1, 6, 7]])
+    np.testing.assert_array_equal(out_y, [[5, 1, 3, -4]])
+
+
+def test_downsample_minmax_bucket_size_one_is_identity() -> None:
+    x = np.arange(5.0)
+    y = np.arange(10.0).reshape(2, 5)
+
+    out_x, out_y = _downsample_minmax(x, y, 1)
+
+    np.testing.assert_array_equal(out_x, [x, x])
+    np.testing.assert_array_equal(out_y, y)